@@ -0,0 +1 @@
+"""Benchmarks for the address book package."""
@@ -0,0 +1,64 @@
+"""
+Benchmark duplicate detection and merging.
+
+Run from the repository root:
+
+    python -m benchmarks.dedup --size 200000 --duplicates 0.01
+"""
+
+import argparse
+import random
+import time
+
+from task.dedup import find_duplicates, group_duplicates, merge_duplicates
+from task.models import Record
+
+from .synthetic import make_book, synthetic_name
+from .timing import report
+
+
+def main() -> None:
+    """Run the benchmark."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=200_000, help="number of records")
+    parser.add_argument(
+        "--duplicates", type=float, default=0.01, help="share of injected duplicates"
+    )
+    options = parser.parse_args()
+
+    book = make_book(options.size)
+    rng = random.Random(7)
+
+    # Inject lowercase name variants that share one phone with the original
+    injected = int(options.size * options.duplicates)
+    expected = set()
+    for index in rng.sample(range(options.size), injected):
+        name = synthetic_name(index)
+        duplicate = Record(name.lower())
+        duplicate.add_phone(book[name].phones[0].value)
+        book.add_record(duplicate)
+        expected.add((name, name.lower()))
+
+    start = time.perf_counter()
+    candidates = find_duplicates(book)
+    report("find duplicates", time.perf_counter() - start)
+
+    start = time.perf_counter()
+    groups = group_duplicates(candidates)
+    report("group duplicates", time.perf_counter() - start)
+
+    start = time.perf_counter()
+    merged = merge_duplicates(book)
+    report("find + merge duplicates", time.perf_counter() - start)
+
+    false_merges = sum(tuple(group) not in expected for group in merged)
+    print(
+        f"Records: {options.size + injected}, injected: {injected}, "
+        f"groups: {len(groups)}, merged: {len(merged)}, "
+        f"false merges: {false_merges}, left: {len(book)}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Benchmark hit and miss latency of lookups, raising versus returning misses.
+
+Run from the repository root:
+
+    python -m benchmarks.lookup_misses --number 200000
+"""
+
+import argparse
+import sys
+import timeit
+from pathlib import Path
+
+from task.models import PhoneNotFoundError, Record
+
+# CLI modules use flat imports, as when running task/main.py
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "task"))
+
+# pylint: disable=wrong-import-position,import-error
+from decorators import colored_output, input_error, validate_args  # noqa: E402
+from handlers import show_phone  # noqa: E402
+from messages import error_invalid_name_format  # noqa: E402
+from validators import is_valid_name  # noqa: E402
+
+
+@colored_output()
+@input_error
+@validate_args(
+    required_count=1,
+    validators={0: is_valid_name},
+    error_messages={0: error_invalid_name_format},
+)
+def raising_show_phone(args: list[str], contacts: dict[str, str]) -> str:
+    """Previous handler: a miss raises KeyError caught by `input_error`."""
+
+    return contacts[args[0]]
+
+
+def raising_edit(record: Record, old_phone: str) -> bool:
+    """Edit via the raising API, catching the miss."""
+
+    try:
+        record.edit_phone(old_phone, "0500000000")
+        return True
+    except PhoneNotFoundError:
+        return False
+
+
+def main() -> None:
+    """Run the benchmark."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--number", type=int, default=200_000)
+    options = parser.parse_args()
+
+    contacts = {"John": "0501234567"}
+    record = Record("John")
+    record.add_phone("0500000000")
+
+    cases = [
+        ("handler hit (raising)", lambda: raising_show_phone(["John"], contacts)),
+        ("handler hit (result)", lambda: show_phone(["John"], contacts)),
+        ("handler miss (raising)", lambda: raising_show_phone(["Jane"], contacts)),
+        ("handler miss (result)", lambda: show_phone(["Jane"], contacts)),
+        ("record edit hit (raising)", lambda: raising_edit(record, "0500000000")),
+        (
+            "record edit hit (result)",
+            lambda: record.try_edit_phone("0500000000", "0500000000"),
+        ),
+        ("record edit miss (raising)", lambda: raising_edit(record, "0999999999")),
+        (
+            "record edit miss (result)",
+            lambda: record.try_edit_phone("0999999999", "0500000000"),
+        ),
+    ]
+
+    for label, func in cases:
+        seconds = min(timeit.repeat(func, number=options.number, repeat=3))
+        print(f"{label:<32} {seconds / options.number * 1e9:>10.0f} ns/op")
+
+
+if __name__ == "__main__":
+    main()
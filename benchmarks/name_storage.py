@@ -0,0 +1,107 @@
+"""
+Memory report for contact name storage.
+
+Builds a synthetic book, then re-imports every contact (as an update from an
+external source would) so each name arrives twice as independent strings.
+Compares bytes per contact of plain dict assignment (the re-imported record
+keeps a second copy of its name) and of `add_record` (one shared copy), the
+extra cost of the name id table, and the size of names as Python strings
+versus the packed UTF-8 arena of read replica snapshots.
+
+Run from the repository root:
+
+    python -m benchmarks.name_storage --size 1000000
+"""
+
+import argparse
+import gc
+import sys
+import tracemalloc
+
+from task.models import AddressBook, Record
+
+from .synthetic import synthetic_name
+
+
+def build(size: int, shared: bool) -> AddressBook:
+    """Build a book and re-import every contact once."""
+
+    book = AddressBook()
+    for _ in range(2):
+        for index in range(size):
+            record = Record(synthetic_name(index))
+            if shared:
+                book.add_record(record)
+            else:
+                # Plain dict assignment: the old key survives next to the new name
+                book.data[record.name.value] = record
+
+    return book
+
+
+def measure(size: int, shared: bool) -> tuple[AddressBook, int]:
+    """Return the book and the bytes it holds after building it."""
+
+    gc.collect()
+    tracemalloc.start()
+    book = build(size, shared)
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return book, current
+
+
+def measure_names(book: AddressBook) -> int:
+    """Return the bytes of the name id table, built on first use."""
+
+    gc.collect()
+    tracemalloc.start()
+    names = book.names
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del names
+    return current
+
+
+def main() -> None:
+    """Run the memory report."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=1_000_000, help="number of records")
+    options = parser.parse_args()
+    size = options.size
+
+    plain_book, plain_bytes = measure(size, shared=False)
+    plain_shared = sum(
+        1 for key, record in plain_book.data.items() if key is record.name.value
+    )
+    del plain_book
+
+    book, book_bytes = measure(size, shared=True)
+    book_shared = sum(
+        1 for key, record in book.data.items() if key is record.name.value
+    )
+    table_bytes = measure_names(book)
+
+    string_bytes = sum(sys.getsizeof(name) for name in book.data)
+    # Layout of the name arena in read replica snapshots (task/replicas.py)
+    arena = b"".join(name.encode("utf-8") for name in book.data)
+    arena_bytes = len(arena) + 8 * (len(book.data) + 1)
+
+    print(f"Records: {size}")
+    print(
+        f"{'plain dict keys':<32} {plain_bytes / size:>8.1f} bytes/contact"
+        f"  (key shared with record: {plain_shared})"
+    )
+    print(
+        f"{'add_record (shared key)':<32} {book_bytes / size:>8.1f} bytes/contact"
+        f"  (key shared with record: {book_shared})"
+    )
+    print(f"{'name id table (on first use)':<32} {table_bytes / size:>8.1f} bytes/name")
+    print(f"{'names as str objects':<32} {string_bytes / size:>8.1f} bytes/name")
+    print(f"{'names in packed arena':<32} {arena_bytes / size:>8.1f} bytes/name")
+
+
+if __name__ == "__main__":
+    main()
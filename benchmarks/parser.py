@@ -0,0 +1,73 @@
+"""
+Benchmark the command parser in batch mode.
+
+Run from the repository root:
+
+    python -m benchmarks.parser --lines 1000000
+"""
+
+import argparse
+import random
+
+from task.input_parser import parse_lines
+
+from .synthetic import synthetic_name, synthetic_phone
+from .timing import best_of
+
+
+def split_parse(line: str) -> tuple[str, list[str]]:
+    """Previous parser: plain whitespace split, no quotes or schemas."""
+
+    if not line or not line.strip():
+        return "", []
+    cmd, *args = line.split()
+    return cmd.strip().lower(), args
+
+
+def make_lines(count: int, quoted: bool) -> list[str]:
+    """Generate a mix of add/change/phone/all command lines."""
+
+    rng = random.Random(3)
+    lines = []
+    for index in range(count):
+        name = synthetic_name(index % 10_000)
+        if quoted:
+            name = f'"{name}"'
+        kind = rng.random()
+        if kind < 0.4:
+            lines.append(f"add {name} {synthetic_phone(rng)}")
+        elif kind < 0.6:
+            lines.append(f"change {name} {synthetic_phone(rng)}")
+        elif kind < 0.95:
+            lines.append(f"phone {name}")
+        else:
+            lines.append("all")
+    return lines
+
+
+def main() -> None:
+    """Run the benchmark."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--lines", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    options = parser.parse_args()
+
+    cases = [
+        ("split (previous parser)", make_lines(options.lines, False), split_parse),
+        ("parse_lines, bare names", make_lines(options.lines, False), None),
+        ("parse_lines, quoted names", make_lines(options.lines, True), None),
+    ]
+
+    print(f"Lines: {options.lines}")
+    for label, lines, func in cases:
+        if func is None:
+            seconds = best_of(lambda: list(parse_lines(lines)), options.repeat)
+        else:
+            seconds = best_of(lambda: [func(line) for line in lines], options.repeat)
+        rate = options.lines / seconds * 60
+        print(f"{label:<32} {seconds:>8.2f} s  {rate / 1e6:>8.1f} M lines/min")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Benchmark vectorized phone analytics against pure-Python loops.
+
+Both implementations are checked for agreement by test_analytics.py.
+
+Run from the repository root:
+
+    python -m benchmarks.phone_analytics --size 200000
+"""
+
+import argparse
+from collections import Counter, defaultdict
+
+from task.analytics import PhoneColumns
+
+from .synthetic import make_book
+from .timing import best_of, report
+
+
+def python_prefix_histogram(book, length: int = 3) -> dict[str, int]:
+    """Count phones per prefix by walking every record."""
+
+    counts = Counter(
+        phone.value[:length] for record in book.data.values() for phone in record.phones
+    )
+    return dict(sorted(counts.items()))
+
+
+def python_shared_phones(book) -> dict[str, list[str]]:
+    """Find phones owned by several contacts by walking every record."""
+
+    owners = defaultdict(set)
+    for name, record in book.data.items():
+        for phone in record.phones:
+            owners[phone.value].add(name)
+
+    return {phone: sorted(names) for phone, names in owners.items() if len(names) > 1}
+
+
+def python_range_query(book, low: str, high: str) -> list[tuple[str, str]]:
+    """Find phones within an inclusive range by walking every record."""
+
+    return sorted(
+        (phone.value, name)
+        for name, record in book.data.items()
+        for phone in record.phones
+        if low <= phone.value <= high
+    )
+
+
+def main() -> None:
+    """Run the benchmark."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=200_000, help="number of records")
+    parser.add_argument("--repeat", type=int, default=3)
+    options = parser.parse_args()
+
+    book = make_book(options.size)
+    build_time = best_of(lambda: PhoneColumns.from_book(book), options.repeat)
+    columns = PhoneColumns.from_book(book)
+    low, high = "0500000000", "0509999999"
+
+    print(f"Records: {options.size}, phones: {len(columns)}")
+    report("build columns", build_time)
+
+    cases = [
+        (
+            "prefix histogram",
+            lambda: python_prefix_histogram(book),
+            columns.prefix_histogram,
+        ),
+        (
+            "shared phones",
+            lambda: python_shared_phones(book),
+            columns.shared_phones,
+        ),
+        (
+            "range query 050xxxxxxx",
+            lambda: python_range_query(book, low, high),
+            lambda: columns.range_query(low, high),
+        ),
+    ]
+
+    for label, python_func, numpy_func in cases:
+        baseline = best_of(python_func, options.repeat)
+        report(f"{label} (python)", baseline)
+        report(f"{label} (numpy)", best_of(numpy_func, options.repeat), baseline)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Synthetic address book generation for benchmarks."""
+
+import random
+import string
+
+from task.models import AddressBook, Record
+
+OPERATOR_PREFIXES = (
+    "050",
+    "063",
+    "066",
+    "067",
+    "068",
+    "073",
+    "093",
+    "095",
+    "097",
+    "098",
+)
+
+
+def synthetic_name(index: int) -> str:
+    """Return a unique valid contact name for the given index."""
+
+    letters = []
+    while True:
+        index, digit = divmod(index, 26)
+        letters.append(string.ascii_lowercase[digit])
+        if not index:
+            break
+
+    return f"Contact {''.join(letters).capitalize()}"
+
+
+def synthetic_phone(rng: random.Random) -> str:
+    """Return a random local phone number with a real operator prefix."""
+
+    return f"{rng.choice(OPERATOR_PREFIXES)}{rng.randrange(10**7):07d}"
+
+
+def make_book(size: int, phones_per_record: int = 2, seed: int = 42) -> AddressBook:
+    """
+    Build an address book with `size` records.
+
+    Args:
+        size: Number of records.
+        phones_per_record: Number of phones in every record.
+        seed: Random seed for reproducible phone numbers.
+
+    Returns:
+        Populated AddressBook.
+    """
+
+    rng = random.Random(seed)
+    book = AddressBook()
+
+    for index in range(size):
+        record = Record(synthetic_name(index))
+        for _ in range(phones_per_record):
+            record.add_phone(synthetic_phone(rng))
+        book.add_record(record)
+
+    return book
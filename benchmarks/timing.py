@@ -0,0 +1,25 @@
+"""Timing helpers for benchmarks."""
+
+import time
+from typing import Any, Callable
+
+
+def best_of(func: Callable[[], Any], repeat: int = 3) -> float:
+    """Run `func` `repeat` times and return the best wall time in seconds."""
+
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+def report(label: str, seconds: float, baseline: float | None = None) -> None:
+    """Print a single benchmark line, with speedup if a baseline is given."""
+
+    line = f"{label:<40} {seconds * 1000:>10.2f} ms"
+    if baseline is not None and seconds > 0:
+        line += f"  ({baseline / seconds:.1f}x)"
+    print(line)
@@ -0,0 +1,193 @@
+"""
+Phone analytics module for the address book.
+
+This module builds a columnar view of all phone numbers in an address book
+and answers reporting queries with vectorized NumPy operations:
+- Operator prefix histograms (050, 067, 098, ...)
+- Numbers shared by several contacts
+- Phone range and prefix queries
+
+Every `Phone` is packed with the phone index key (digits left-aligned in 15
+positions plus the digit count), so local and international numbers fit into
+one int64 column. Owners are referenced by integer ids into a names table.
+"""
+
+from typing import Any, Mapping
+
+import numpy as np
+
+from task.phone_index import (
+    KEY_DIGITS,
+    LENGTH_BITS,
+    key_phone,
+    phone_key,
+    prefix_bounds,
+)
+
+
+def _label(digits: str) -> str:
+    """Return a prefix label, with "+" for international numbers."""
+
+    return digits if digits.startswith("0") else f"+{digits}"
+
+
+class PhoneColumns:
+    """Columnar snapshot of all phones in an address book."""
+
+    def __init__(
+        self, phones: np.ndarray, owners: np.ndarray, names: list[str]
+    ) -> None:
+        """
+        Initialize columns.
+
+        Args:
+            phones: int64 array with one entry per phone number.
+            owners: int64 array of the same length with owner ids.
+            names: Names table indexed by owner id.
+        """
+
+        self.phones: np.ndarray = phones
+        self.owners: np.ndarray = owners
+        self.names: list[str] = names
+
+    @classmethod
+    def from_book(cls, book: Mapping[str, Any]) -> "PhoneColumns":
+        """
+        Build phone columns from an `AddressBook`.
+
+        Args:
+            book: Mapping of names to records with a `phones` list.
+
+        Returns:
+            PhoneColumns with one row per (phone, owner) pair.
+        """
+
+        names: list[str] = []
+        phones: list[int] = []
+        owners: list[int] = []
+
+        for owner_id, (name, record) in enumerate(book.items()):
+            names.append(name)
+            for phone in record.phones:
+                phones.append(phone_key(phone.value))
+                owners.append(owner_id)
+
+        return cls(
+            np.array(phones, dtype=np.int64),
+            np.array(owners, dtype=np.int64),
+            names,
+        )
+
+    def __len__(self) -> int:
+        """Return number of (phone, owner) rows."""
+
+        return len(self.phones)
+
+    def prefix_histogram(self, length: int = 3) -> dict[str, int]:
+        """
+        Count phone numbers per prefix.
+
+        Args:
+            length: Number of leading digits forming the prefix (1-15).
+
+        Returns:
+            Dictionary mapping prefix (e.g. "050", or "+380" for international
+            numbers) to the number of phones, sorted by digits. Phones with
+            fewer than `length` digits are not counted.
+
+        Example:
+            >>> columns.prefix_histogram()
+            {"050": 2, "098": 1}
+        """
+
+        if not 1 <= length <= KEY_DIGITS:
+            raise ValueError(f"Prefix length must be between 1 and {KEY_DIGITS}")
+
+        # Keys pad digits with zeros, so skip phones shorter than the prefix
+        phones = self.phones[(self.phones & ((1 << LENGTH_BITS) - 1)) >= length]
+        prefixes = (phones >> LENGTH_BITS) // 10 ** (KEY_DIGITS - length)
+        values, counts = np.unique(prefixes, return_counts=True)
+
+        return {
+            _label(str(value).zfill(length)): int(count)
+            for value, count in zip(values.tolist(), counts.tolist())
+        }
+
+    def shared_phones(self) -> dict[str, list[str]]:
+        """
+        Find phone numbers that belong to more than one contact.
+
+        Returns:
+            Dictionary mapping each shared phone to the list of owner names.
+        """
+
+        if not len(self):
+            return {}
+
+        # Unique (phone, owner) pairs sorted by phone, then owner
+        order = np.lexsort((self.owners, self.phones))
+        phones = self.phones[order]
+        owners = self.owners[order]
+        distinct = np.ones(len(phones), dtype=bool)
+        distinct[1:] = (phones[1:] != phones[:-1]) | (owners[1:] != owners[:-1])
+        phones = phones[distinct]
+        owners = owners[distinct]
+
+        values, starts, counts = np.unique(
+            phones, return_index=True, return_counts=True
+        )
+        shared = counts > 1
+
+        return {
+            key_phone(value): [
+                self.names[owner] for owner in owners[start : start + count].tolist()
+            ]
+            for value, start, count in zip(
+                values[shared].tolist(),
+                starts[shared].tolist(),
+                counts[shared].tolist(),
+            )
+        }
+
+    def range_query(self, low: str, high: str) -> list[tuple[str, str]]:
+        """
+        Find phones within an inclusive range.
+
+        Args:
+            low: Lowest phone number of the range.
+            high: Highest phone number of the range.
+
+        Returns:
+            List of (phone, owner name) pairs sorted by phone.
+        """
+
+        return self._select(phone_key(low), phone_key(high))
+
+    def prefix_query(self, prefix: str) -> list[tuple[str, str]]:
+        """
+        Find phones starting with the given digits.
+
+        Args:
+            prefix: Leading digits of the phone number, e.g. "050123".
+
+        Returns:
+            List of (phone, owner name) pairs sorted by phone.
+        """
+
+        bounds = prefix_bounds(prefix)
+        if bounds is None:
+            return []
+        return self._select(*bounds)
+
+    def _select(self, low: int, high: int) -> list[tuple[str, str]]:
+        """Return (phone, owner name) pairs with phones in [low, high]."""
+
+        mask = (self.phones >= low) & (self.phones <= high)
+        phones = self.phones[mask]
+        owners = self.owners[mask]
+        order = np.argsort(phones, kind="stable")
+
+        return [
+            (key_phone(phone), self.names[owner])
+            for phone, owner in zip(phones[order].tolist(), owners[order].tolist())
+        ]
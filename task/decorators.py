@@ -5,25 +5,34 @@ This module provides reusable decorators for:
 - Error handling in command handlers
 - Colored output for different message types
 - Input validation and argument handling
+
+Each decorator has an `async_` variant for coroutine handlers.
 """
 
 from functools import wraps
-from typing import Callable, Any, Optional
+from typing import Awaitable, Callable, Any, Optional
 from colorama import Fore, Style
 from message_texts import (
     INPUT_ERROR_MISSING_ARGS,
     INPUT_ERROR_CONTACT_NOT_FOUND,
     INPUT_ERROR_ENTER_NAME,
-    UNKNOWN_COMMAND,
     INVALID_ARGUMENT_FORMAT,
 )
 
+# Global switch for colored output (see `set_color_enabled`)
+_color_settings: dict[str, bool] = {"enabled": True}
+
+
+def set_color_enabled(enabled: bool) -> None:
+    """Enable or disable coloring in `colored_output` and `output_formatter`."""
+
+    _color_settings["enabled"] = enabled
+
 
 def validate_args(
     required_count: int,
     validators: Optional[dict[int, Callable[[str], bool]]] = None,
-    error_messages: Optional[dict[int, str]] = None,
-    normalize_args: bool = False,
+    error_messages: Optional[dict[int, str | Callable[[], str]]] = None,
 ) -> Callable:
     """
     Decorator to validate command arguments before execution.
@@ -36,7 +45,7 @@ def validate_args(
         validators: Optional dict mapping argument index to validation function.
                    Example: {1: lambda x: x.isdigit()} to check if arg[1] is numeric.
         error_messages: Optional dict mapping argument index to custom error messages.
-        normalize_args: When True, combines multi-word name arguments into a single value.
+                        A message may be a callable, rendered when the error occurs.
 
     Returns:
         Decorator function that validates arguments before calling handler.
@@ -56,34 +65,80 @@ def validate_args(
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         def wrapper(args: list[str], *other_args: Any, **kwargs: Any) -> str:
-            normalized_args = args
-            if normalize_args:
-                if required_count == 1 and len(args) > 1:
-                    normalized_args = [" ".join(args)]
-                elif required_count == 2 and len(args) > 2:
-                    normalized_args = [" ".join(args[:-1]), args[-1]]
-
-            # Check if we have enough arguments
-            if len(normalized_args) < required_count:
-                raise ValueError
-
-            # Validate argument formats if validators provided
-            if validators:
-                for idx, validator in validators.items():
-                    if idx < len(normalized_args):
-                        if not validator(normalized_args[idx]):
-                            if error_messages and idx in error_messages:
-                                return error_messages[idx]
-                            else:
-                                return INVALID_ARGUMENT_FORMAT.format(arg_index=idx + 1)
-
-            return func(normalized_args, *other_args, **kwargs)
+            error = _check_args(args, required_count, validators, error_messages)
+            if error is not None:
+                return error
+
+            return func(args, *other_args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def async_validate_args(
+    required_count: int,
+    validators: Optional[dict[int, Callable[[str], bool]]] = None,
+    error_messages: Optional[dict[int, str | Callable[[], str]]] = None,
+) -> Callable:
+    """
+    Async variant of `validate_args` for coroutine command handlers.
+
+    Takes the same arguments and applies the same checks before awaiting
+    the wrapped coroutine.
+    """
+
+    def decorator(func: Callable[..., Awaitable[str]]) -> Callable[..., Awaitable[str]]:
+        @wraps(func)
+        async def wrapper(args: list[str], *other_args: Any, **kwargs: Any) -> str:
+            error = _check_args(args, required_count, validators, error_messages)
+            if error is not None:
+                return error
+
+            return await func(args, *other_args, **kwargs)
 
         return wrapper
 
     return decorator
 
 
+def _check_args(
+    args: list[str],
+    required_count: int,
+    validators: Optional[dict[int, Callable[[str], bool]]],
+    error_messages: Optional[dict[int, str | Callable[[], str]]],
+) -> str | None:
+    """
+    Validate handler arguments.
+
+    Arguments are expected one per field, as shaped by `parse_input`, so
+    multi-word names arrive already joined.
+
+    Returns:
+        Error message string if an argument has an invalid format, else None.
+
+    Raises:
+        ValueError: If fewer than `required_count` arguments are given.
+    """
+
+    # Check if we have enough arguments
+    if len(args) < required_count:
+        raise ValueError
+
+    # Validate argument formats if validators provided
+    if validators:
+        for idx, validator in validators.items():
+            if idx < len(args):
+                if not validator(args[idx]):
+                    if error_messages and idx in error_messages:
+                        message = error_messages[idx]
+                        return message() if callable(message) else message
+                    else:
+                        return INVALID_ARGUMENT_FORMAT.format(arg_index=idx + 1)
+
+    return None
+
+
 def input_error(func: Callable) -> Callable:
     """
     Decorator to handle input errors in command handler functions.
@@ -109,18 +164,42 @@ def input_error(func: Callable) -> Callable:
     def inner(*args: Any, **kwargs: Any) -> str:
         try:
             return func(*args, **kwargs)
-        except ValueError:
-            return INPUT_ERROR_MISSING_ARGS
-        except KeyError as exc:
-            if exc.args and exc.args[0] == "unknown_command":
-                return UNKNOWN_COMMAND
-            return INPUT_ERROR_CONTACT_NOT_FOUND
-        except IndexError:
-            return INPUT_ERROR_ENTER_NAME
+        except (ValueError, KeyError, IndexError) as exc:
+            return _input_error_message(exc)
 
     return inner
 
 
+def async_input_error(
+    func: Callable[..., Awaitable[str]],
+) -> Callable[..., Awaitable[str]]:
+    """
+    Async variant of `input_error` for coroutine command handlers.
+
+    Catches the same exceptions raised while awaiting the wrapped coroutine
+    and returns the same user-friendly messages.
+    """
+
+    @wraps(func)
+    async def inner(*args: Any, **kwargs: Any) -> str:
+        try:
+            return await func(*args, **kwargs)
+        except (ValueError, KeyError, IndexError) as exc:
+            return _input_error_message(exc)
+
+    return inner
+
+
+def _input_error_message(exc: Exception) -> str:
+    """Map an input exception to a user-friendly error message."""
+
+    if isinstance(exc, KeyError):
+        return INPUT_ERROR_CONTACT_NOT_FOUND
+    if isinstance(exc, IndexError):
+        return INPUT_ERROR_ENTER_NAME
+    return INPUT_ERROR_MISSING_ARGS
+
+
 def colored_output(
     success_color: str = Fore.GREEN,
     error_color: str = Fore.RED,
@@ -153,41 +232,71 @@ def colored_output(
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> str:
             result = func(*args, **kwargs)
+            return _colorize(result, success_color, error_color, info_color)
+
+        return wrapper
+
+    return decorator
 
-            # Determine color based on message content
-            if isinstance(result, str):
-                if Style.RESET_ALL in result:
-                    return result
-
-                result_lower = result.lower()
-
-                if any(
-                    word in result_lower
-                    for word in [
-                        "error",
-                        "not found",
-                        "invalid",
-                        "give me",
-                        "unknown",
-                    ]
-                ):
-                    color = error_color
-                elif any(
-                    word in result_lower for word in ["added", "updated", "contact"]
-                ):
-                    color = success_color
-                else:
-                    color = info_color
-            else:
-                color = info_color
-
-            return f"{color}{result}{Style.RESET_ALL}"
+
+def async_colored_output(
+    success_color: str = Fore.GREEN,
+    error_color: str = Fore.RED,
+    info_color: str = Fore.BLUE,
+) -> Callable:
+    """
+    Async variant of `colored_output` for coroutine command handlers.
+
+    Colors the awaited result with the same rules as `colored_output`.
+    """
+
+    def decorator(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[str]]:
+        @wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> str:
+            result = await func(*args, **kwargs)
+            return _colorize(result, success_color, error_color, info_color)
 
         return wrapper
 
     return decorator
 
 
+def _colorize(
+    result: Any, success_color: str, error_color: str, info_color: str
+) -> str:
+    """Color a handler result based on its content."""
+
+    if not _color_settings["enabled"]:
+        return result if isinstance(result, str) else str(result)
+
+    # Determine color based on message content
+    if isinstance(result, str):
+        if Style.RESET_ALL in result:
+            return result
+
+        result_lower = result.lower()
+
+        if any(
+            word in result_lower
+            for word in [
+                "error",
+                "not found",
+                "invalid",
+                "give me",
+                "unknown",
+            ]
+        ):
+            color = error_color
+        elif any(word in result_lower for word in ["added", "updated", "contact"]):
+            color = success_color
+        else:
+            color = info_color
+    else:
+        color = info_color
+
+    return f"{color}{result}{Style.RESET_ALL}"
+
+
 def output_formatter(color: str = Fore.WHITE, bold: bool = False) -> Callable:
     """
     Decorator to format function output with specific color and style.
@@ -214,6 +323,8 @@ def output_formatter(color: str = Fore.WHITE, bold: bool = False) -> Callable:
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> str:
             result = func(*args, **kwargs)
+            if not _color_settings["enabled"]:
+                return result
             style = Style.BRIGHT if bold else ""
 
             return f"{style}{color}{result}{Style.RESET_ALL}"
@@ -0,0 +1,267 @@
+"""
+Duplicate detection module for the address book.
+
+This module finds and merges duplicate contacts:
+- Blocking by normalized name ("John  Smith" == "john smith")
+- Blocking by shared phone number
+- Scoring candidate pairs by name similarity and phone overlap
+- Merging duplicates by folding phones into one record
+
+A pair is only scored if the names are nearly equal; phone overlap alone
+never makes two contacts duplicates (family members share a home number).
+Neither signal alone reaches the default threshold, and `merge_duplicates`
+uses a stricter one, so merging weaker pairs has to be asked for.
+
+Candidates are produced by hash joins on the blocking keys instead of
+comparing all pairs of records, so the work grows with the number of
+records plus the size of each block.
+"""
+
+import re
+from collections import defaultdict
+from difflib import SequenceMatcher
+from typing import Any, Iterable, Iterator, MutableMapping, NamedTuple
+
+DEFAULT_THRESHOLD = 0.75
+MERGE_THRESHOLD = 0.9
+DEFAULT_MAX_BLOCK_SIZE = 50
+MIN_NAME_SIMILARITY = 0.9
+NAME_WEIGHT = 0.5
+PHONE_WEIGHT = 0.5
+
+
+class DuplicateCandidate(NamedTuple):
+    """Pair of possibly duplicate contacts with a similarity score."""
+
+    first: str
+    second: str
+    score: float
+
+
+def normalize_name(name: str) -> str:
+    """
+    Normalize a name for duplicate blocking.
+
+    Lowercases, treats hyphens as spaces, drops apostrophes and collapses
+    whitespace.
+
+    Example:
+        >>> normalize_name("John  Smith")
+        "john smith"
+        >>> normalize_name("O'Brien-Lee")
+        "obrien lee"
+    """
+
+    return " ".join(re.split(r"[\s-]+", name.casefold().replace("'", ""))).strip()
+
+
+def _phone_set(record: Any) -> frozenset[str]:
+    """Return the set of phone values of a record."""
+
+    return frozenset(phone.value for phone in record.phones)
+
+
+def score_pair(
+    first_name: str,
+    first_phones: frozenset[str],
+    second_name: str,
+    second_phones: frozenset[str],
+) -> float:
+    """
+    Score how likely two contacts are the same person.
+
+    The score combines name similarity (1.0 for equal normalized names) and
+    phone overlap relative to the smaller phone set. Names less similar than
+    `MIN_NAME_SIMILARITY` score 0.0 whatever phones they share.
+
+    Returns:
+        Score between 0.0 and 1.0.
+
+    Example:
+        >>> score_pair("John Smith", {"0501234567"}, "john smith", {"0501234567"})
+        1.0
+        >>> score_pair("Anna Smith", {"0501234567"}, "John Smith", {"0501234567"})
+        0.0
+        >>> score_pair("John Smith", {"0501234567"}, "John Smith", {"0671234567"})
+        0.5
+    """
+
+    first_key = normalize_name(first_name)
+    second_key = normalize_name(second_name)
+    if first_key == second_key:
+        name_score = 1.0
+    else:
+        name_score = SequenceMatcher(None, first_key, second_key).ratio()
+        if name_score < MIN_NAME_SIMILARITY:
+            return 0.0
+
+    smaller = min(len(first_phones), len(second_phones))
+    phone_score = len(first_phones & second_phones) / smaller if smaller else 0.0
+
+    return NAME_WEIGHT * name_score + PHONE_WEIGHT * phone_score
+
+
+def _blocks(book: MutableMapping[str, Any]) -> Iterator[list[str]]:
+    """Yield groups of record names sharing a normalized name or a phone."""
+
+    by_name: dict[str, list[str]] = defaultdict(list)
+    by_phone: dict[str, list[str]] = defaultdict(list)
+
+    for name, record in book.items():
+        by_name[normalize_name(name)].append(name)
+        for phone in _phone_set(record):
+            by_phone[phone].append(name)
+
+    for block in by_name.values():
+        if len(block) > 1:
+            yield block
+    for block in by_phone.values():
+        if len(block) > 1:
+            yield block
+
+
+def find_duplicates(
+    book: MutableMapping[str, Any],
+    threshold: float = DEFAULT_THRESHOLD,
+    max_block_size: int = DEFAULT_MAX_BLOCK_SIZE,
+) -> list[DuplicateCandidate]:
+    """
+    Find pairs of records that are likely duplicates.
+
+    Args:
+        book: AddressBook (or any mapping of names to records).
+        threshold: Minimum score for a pair to be reported.
+        max_block_size: Blocks larger than this are skipped, so a phone shared
+                        by thousands of contacts (e.g. an office switchboard)
+                        does not cause a quadratic blow-up.
+
+    Returns:
+        Candidates sorted by descending score.
+
+    Example:
+        >>> find_duplicates(book)
+        [DuplicateCandidate(first="John Smith", second="john smith", score=1.0)]
+    """
+
+    phones: dict[str, frozenset[str]] = {}
+    seen: set[tuple[str, str]] = set()
+    candidates: list[DuplicateCandidate] = []
+
+    for block in _blocks(book):
+        if len(block) > max_block_size:
+            continue
+
+        for i, first in enumerate(block):
+            for second in block[i + 1 :]:
+                pair = (first, second) if first < second else (second, first)
+                if pair in seen:
+                    continue
+                seen.add(pair)
+
+                for name in pair:
+                    if name not in phones:
+                        phones[name] = _phone_set(book[name])
+
+                score = score_pair(pair[0], phones[pair[0]], pair[1], phones[pair[1]])
+                if score >= threshold:
+                    candidates.append(DuplicateCandidate(pair[0], pair[1], score))
+
+    candidates.sort(key=lambda candidate: (-candidate.score, candidate.first))
+    return candidates
+
+
+def group_duplicates(candidates: Iterable[DuplicateCandidate]) -> list[list[str]]:
+    """
+    Group candidate pairs into clusters of duplicate records.
+
+    Pairs are joined transitively (union-find), so A~B and B~C form one
+    group [A, B, C].
+
+    Returns:
+        List of groups, each a sorted list of record names.
+    """
+
+    parent: dict[str, str] = {}
+
+    def find(name: str) -> str:
+        root = parent.setdefault(name, name)
+        while root != parent[root]:
+            parent[root] = parent[parent[root]]
+            root = parent[root]
+        return root
+
+    for candidate in candidates:
+        first_root = find(candidate.first)
+        second_root = find(candidate.second)
+        if first_root != second_root:
+            parent[second_root] = first_root
+
+    groups: dict[str, list[str]] = defaultdict(list)
+    for name in parent:
+        groups[find(name)].append(name)
+
+    return sorted(sorted(group) for group in groups.values())
+
+
+def merge_records(
+    book: MutableMapping[str, Any], target_name: str, source_names: Iterable[str]
+) -> Any:
+    """
+    Merge records into a target record.
+
+    Phones of every source record are added to the target (skipping phones
+    the target already has), then the source records are deleted.
+
+    Args:
+        book: AddressBook containing the records.
+        target_name: Name of the record that is kept.
+        source_names: Names of records folded into the target.
+
+    Returns:
+        The target record.
+
+    Raises:
+        KeyError: If the target or a source record does not exist.
+    """
+
+    target = book[target_name]
+    existing = set(_phone_set(target))
+
+    for name in source_names:
+        if name == target_name:
+            continue
+        for phone in book[name].phones:
+            if phone.value not in existing:
+                target.add_phone(phone.value)
+                existing.add(phone.value)
+        del book[name]
+
+    return target
+
+
+def merge_duplicates(
+    book: MutableMapping[str, Any],
+    threshold: float = MERGE_THRESHOLD,
+    max_block_size: int = DEFAULT_MAX_BLOCK_SIZE,
+) -> list[list[str]]:
+    """
+    Find duplicate groups and merge each into a single record.
+
+    The record with the most phones is kept; ties keep the record that was
+    added to the book first. By default only pairs with nearly equal names
+    and shared phones are merged; pass a lower `threshold` to also merge
+    weaker candidates reported by `find_duplicates`.
+
+    Returns:
+        Merged groups, each starting with the name of the kept record.
+    """
+
+    order = {name: index for index, name in enumerate(book)}
+    merged: list[list[str]] = []
+
+    for group in group_duplicates(find_duplicates(book, threshold, max_block_size)):
+        group.sort(key=lambda name: (-len(book[name].phones), order[name]))
+        merge_records(book, group[0], group[1:])
+        merged.append(group)
+
+    return merged
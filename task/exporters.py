@@ -0,0 +1,235 @@
+"""
+Exporters module for the contact assistant bot.
+
+This module streams contacts out of an address book in chunks:
+- CSV (name, phones)
+- JSON Lines (one object per contact)
+- vCard 3.0
+
+Rows are produced lazily from the source mapping and written chunk by chunk,
+so memory usage stays constant regardless of the address book size.
+"""
+
+import csv
+import gzip
+import io
+import json
+import re
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, Mapping, Optional, TextIO
+
+ContactRow = tuple[str, list[str]]
+
+DEFAULT_CHUNK_SIZE = 1000
+PHONES_SEPARATOR = ";"
+
+
+def iter_contacts(source: Mapping[str, Any]) -> Iterator[ContactRow]:
+    """
+    Yield (name, phones) rows from an address book.
+
+    Works with both the CLI contacts dictionary (name -> phone string) and
+    `AddressBook` (name -> `Record`).
+
+    Args:
+        source: Mapping of contact names to phone strings or records.
+
+    Yields:
+        Tuples of contact name and list of phone numbers.
+    """
+
+    for name, value in source.items():
+        phones = getattr(value, "phones", None)
+        if phones is None:
+            yield name, [value]
+        else:
+            yield name, [phone.value for phone in phones]
+
+
+def filter_contacts(
+    rows: Iterable[ContactRow],
+    name_prefix: Optional[str] = None,
+    phone_prefix: Optional[str] = None,
+) -> Iterator[ContactRow]:
+    """
+    Filter contact rows by name prefix and/or phone prefix.
+
+    Name prefix matching is case-insensitive. Phone prefix is compared by
+    digits only, so "050-12" matches "0501234567" and "+380" matches
+    "+380501234567". A contact matches the phone filter when at least one of
+    its phones starts with the prefix.
+
+    Args:
+        rows: Contact rows to filter.
+        name_prefix: Optional prefix the contact name must start with.
+        phone_prefix: Optional prefix one of the phones must start with.
+
+    Yields:
+        Rows matching all given filters.
+    """
+
+    name_key = name_prefix.casefold() if name_prefix else None
+    phone_key = re.sub(r"\D", "", phone_prefix) if phone_prefix else None
+
+    for name, phones in rows:
+        if name_key and not name.casefold().startswith(name_key):
+            continue
+        if phone_key and not any(
+            phone.lstrip("+").startswith(phone_key) for phone in phones
+        ):
+            continue
+        yield name, phones
+
+
+def iter_chunks(
+    rows: Iterable[ContactRow], chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[list[ContactRow]]:
+    """Split rows into lists of at most `chunk_size` elements."""
+
+    iterator = iter(rows)
+    while chunk := list(islice(iterator, chunk_size)):
+        yield chunk
+
+
+def _render_csv(chunk: list[ContactRow]) -> str:
+    """Render a chunk of rows as CSV lines."""
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerows((name, PHONES_SEPARATOR.join(phones)) for name, phones in chunk)
+    return buffer.getvalue()
+
+
+def _render_jsonl(chunk: list[ContactRow]) -> str:
+    """Render a chunk of rows as JSON Lines."""
+
+    return "".join(
+        json.dumps({"name": name, "phones": phones}, ensure_ascii=False) + "\n"
+        for name, phones in chunk
+    )
+
+
+def _escape_vcard(value: str) -> str:
+    """Escape special characters in a vCard text value."""
+
+    return (
+        value.replace("\\", "\\\\")
+        .replace(",", "\\,")
+        .replace(";", "\\;")
+        .replace("\n", "\\n")
+    )
+
+
+def _render_vcard(chunk: list[ContactRow]) -> str:
+    """Render a chunk of rows as vCard 3.0 entries."""
+
+    lines: list[str] = []
+    for name, phones in chunk:
+        escaped = _escape_vcard(name)
+        lines.extend(
+            ("BEGIN:VCARD", "VERSION:3.0", f"FN:{escaped}", f"N:{escaped};;;;")
+        )
+        lines.extend(f"TEL;TYPE=CELL:{phone}" for phone in phones)
+        lines.append("END:VCARD")
+    return "\r\n".join(lines) + "\r\n"
+
+
+# Format name -> (header, chunk renderer)
+EXPORT_FORMATS: dict[str, tuple[str, Callable[[list[ContactRow]], str]]] = {
+    "csv": ("name,phones\n", _render_csv),
+    "jsonl": ("", _render_jsonl),
+    "vcf": ("", _render_vcard),
+}
+
+
+def is_supported_format(fmt: str) -> bool:
+    """Check whether the export format is supported."""
+
+    return fmt.lower() in EXPORT_FORMATS
+
+
+def write_contacts(
+    rows: Iterable[ContactRow],
+    stream: TextIO,
+    fmt: str,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
+    """
+    Write contact rows to a text stream in the given format.
+
+    Args:
+        rows: Contact rows to write.
+        stream: Writable text stream.
+        fmt: Export format ("csv", "jsonl" or "vcf").
+        chunk_size: Number of rows rendered and written at once.
+
+    Returns:
+        Number of exported contacts.
+
+    Raises:
+        ValueError: If the format is not supported.
+    """
+
+    if not is_supported_format(fmt):
+        raise ValueError(f"Unsupported export format: {fmt}")
+
+    header, render = EXPORT_FORMATS[fmt.lower()]
+    if header:
+        stream.write(header)
+
+    count = 0
+    for chunk in iter_chunks(rows, chunk_size):
+        stream.write(render(chunk))
+        count += len(chunk)
+
+    return count
+
+
+def export_contacts(
+    source: Mapping[str, Any],
+    path: str,
+    fmt: str,
+    name_prefix: Optional[str] = None,
+    phone_prefix: Optional[str] = None,
+    compress: Optional[bool] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
+    """
+    Export contacts from an address book to a file.
+
+    Args:
+        source: CLI contacts dictionary or `AddressBook`.
+        path: Destination file path.
+        fmt: Export format ("csv", "jsonl" or "vcf").
+        name_prefix: Optional name prefix filter.
+        phone_prefix: Optional phone prefix filter. For an `AddressBook` it
+                      is mapped through the book's phone policy first, so
+                      "050" matches "+380501234567" in a UA book.
+        compress: Write gzip-compressed output. When None, compression is
+                  enabled if the path ends with ".gz".
+        chunk_size: Number of rows rendered and written at once.
+
+    Returns:
+        Number of exported contacts.
+
+    Example:
+        >>> contacts = {"John": "0501234567"}
+        >>> export_contacts(contacts, "contacts.csv.gz", "csv")
+        1
+    """
+
+    if compress is None:
+        compress = path.endswith(".gz")
+
+    policy = getattr(source, "policy", None)
+    if phone_prefix and policy is not None:
+        phone_prefix = policy.canonical_prefix(phone_prefix)
+
+    rows = filter_contacts(iter_contacts(source), name_prefix, phone_prefix)
+
+    if compress:
+        with gzip.open(path, "wt", encoding="utf-8", newline="") as stream:
+            return write_contacts(rows, stream, fmt, chunk_size)
+
+    with open(path, "w", encoding="utf-8", newline="") as stream:
+        return write_contacts(rows, stream, fmt, chunk_size)
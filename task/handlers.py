@@ -1,12 +1,37 @@
-from typing import Callable
-
-from decorators import input_error, colored_output, validate_args
-from validators import is_valid_phone, is_valid_name
+import asyncio
+import inspect
+import threading
+from typing import Any, Callable
+
+from decorators import (
+    async_colored_output,
+    async_input_error,
+    colored_output,
+    input_error,
+    validate_args,
+)
+from validators import (
+    get_phone_policy,
+    is_valid_phone,
+    is_valid_phone_prefix,
+    is_valid_name,
+)
+from phone_index import PhoneIndex
+from exporters import export_contacts as write_export, is_supported_format
+from message_texts import (
+    EXPORT_SUCCESS,
+    INPUT_ERROR_CONTACT_NOT_FOUND,
+    UNKNOWN_COMMAND,
+)
 from messages import (
     hello_message,
     error_unexpected_arguments,
     error_invalid_name_format,
     error_invalid_phone_format,
+    error_invalid_phone_prefix,
+    error_invalid_export_format,
+    error_invalid_export_filter,
+    error_export_failed,
     no_contacts_found_message,
 )
 
@@ -17,16 +42,16 @@ from messages import (
     required_count=2,
     validators={0: is_valid_name, 1: is_valid_phone},
     error_messages={
-        0: error_invalid_name_format(),
-        1: error_invalid_phone_format(),
+        0: error_invalid_name_format,
+        1: error_invalid_phone_format,
     },
-    normalize_args=True,
 )
 def add_contact(args: list[str], contacts: dict[str, str]) -> str:
     """
     Add a new contact to the contacts dictionary.
 
-    Creates a new contact entry with the provided name and phone number.
+    Creates a new contact entry with the provided name and phone number,
+    stored in the canonical form of the selected phone policy.
     If a contact with the same name exists, it will be overwritten.
 
     Args:
@@ -42,14 +67,14 @@ def add_contact(args: list[str], contacts: dict[str, str]) -> str:
 
     Example:
         >>> contacts = {}
-        >>> add_contact(["John", "1234567890"], contacts)
+        >>> add_contact(["John", "050-123-4567"], contacts)
         "Contact added."
         >>> contacts
-        {"John": "1234567890"}
+        {"John": "0501234567"}
     """
 
     name, phone = args
-    contacts[name] = phone
+    contacts[name] = get_phone_policy().normalize(phone)
     return "Contact added."
 
 
@@ -59,16 +84,16 @@ def add_contact(args: list[str], contacts: dict[str, str]) -> str:
     required_count=2,
     validators={0: is_valid_name, 1: is_valid_phone},
     error_messages={
-        0: error_invalid_name_format(),
-        1: error_invalid_phone_format(),
+        0: error_invalid_name_format,
+        1: error_invalid_phone_format,
     },
-    normalize_args=True,
 )
 def change_contact(args: list[str], contacts: dict[str, str]) -> str:
     """
     Change phone number for an existing contact.
 
-    Updates the phone number for a contact that already exists in the dictionary.
+    Updates the phone number for a contact that already exists in the dictionary,
+    stored in the canonical form of the selected phone policy.
     Contact must exist before updating.
 
     Args:
@@ -77,15 +102,15 @@ def change_contact(args: list[str], contacts: dict[str, str]) -> str:
         contacts: Dictionary containing existing contact information.
 
     Returns:
-        Success message "Contact updated." if contact exists and was updated.
+        Success message "Contact updated." if contact exists and was updated,
+        otherwise "Contact not found." (returned, not raised, so misses stay cheap).
 
     Raises:
         ValueError: If insufficient arguments provided (less than 2).
-        KeyError: If the named contact does not exist in the dictionary.
 
     Example:
-        >>> contacts = {"John": "1234567890"}
-        >>> change_contact(["John", "0987654321"], contacts)
+        >>> contacts = {"John": "0501234567"}
+        >>> change_contact(["John", "(098)765-4321"], contacts)
         "Contact updated."
         >>> contacts
         {"John": "0987654321"}
@@ -93,9 +118,9 @@ def change_contact(args: list[str], contacts: dict[str, str]) -> str:
 
     name, phone = args
     if name not in contacts:
-        raise KeyError
+        return INPUT_ERROR_CONTACT_NOT_FOUND
 
-    contacts[name] = phone
+    contacts[name] = get_phone_policy().normalize(phone)
     return "Contact updated."
 
 
@@ -104,8 +129,7 @@ def change_contact(args: list[str], contacts: dict[str, str]) -> str:
 @validate_args(
     required_count=1,
     validators={0: is_valid_name},
-    error_messages={0: error_invalid_name_format()},
-    normalize_args=True,
+    error_messages={0: error_invalid_name_format},
 )
 def show_phone(args: list[str], contacts: dict[str, str]) -> str:
     """
@@ -119,22 +143,81 @@ def show_phone(args: list[str], contacts: dict[str, str]) -> str:
         contacts: Dictionary containing contact information.
 
     Returns:
-        The phone number string if contact is found.
+        The phone number string if contact is found, otherwise
+        "Contact not found." (returned, not raised, so misses stay cheap).
 
     Raises:
         IndexError: If no arguments provided (empty args list).
-        KeyError: If the named contact does not exist in the dictionary.
 
     Example:
         >>> contacts = {"John": "1234567890"}
         >>> show_phone(["John"], contacts)
         "1234567890"
         >>> show_phone(["Jane"], contacts)
-        Raises KeyError
+        "Contact not found."
     """
 
     name = args[0]
-    return contacts[name]
+    phone = contacts.get(name)
+    if phone is None:
+        return INPUT_ERROR_CONTACT_NOT_FOUND
+
+    return phone
+
+
+@colored_output()
+@input_error
+@validate_args(
+    required_count=1,
+    validators={0: is_valid_phone_prefix},
+    error_messages={0: error_invalid_phone_prefix},
+)
+def find_by_phone_prefix(args: list[str], contacts: dict[str, str]) -> str:
+    """
+    Display contacts whose phone number starts with a prefix.
+
+    Uses the sorted phone index of the contacts (see `IndexedContacts`), so
+    the lookup costs O(log n + k). A plain dictionary is indexed on the fly.
+    The prefix is mapped through the phone policy like stored phones, so
+    "050" finds "+380501234567" under the UA policy.
+
+    Args:
+        args: List of arguments where args[0] is the phone prefix.
+              Must contain at least 1 element.
+        contacts: Dictionary containing contact information.
+
+    Returns:
+        Formatted table of matching contacts sorted by phone, or
+        "No contacts found." if nothing matches.
+
+    Raises:
+        ValueError: If no prefix is provided.
+
+    Example:
+        >>> contacts = IndexedContacts({"Alice": "0501111111", "Bob": "0672222222"})
+        >>> print(find_by_phone_prefix(["050"], contacts))
+        Name  | Phone
+        ----- | -----
+        Alice | 0501111111
+    """
+
+    index = getattr(contacts, "phone_index", None)
+    if index is None:
+        index = PhoneIndex.build((phone, name) for name, phone in contacts.items())
+
+    matches = index.prefix(get_phone_policy().canonical_prefix(args[0]))
+    if not matches:
+        return no_contacts_found_message()
+
+    max_name_len = max(len("Name"), *(len(name) for _, name in matches))
+
+    lines = [
+        f"{'Name'.ljust(max_name_len)} | Phone",
+        f"{'-' * max_name_len} | {'-' * 5}",
+    ]
+    lines.extend(f"{name.ljust(max_name_len)} | {phone}" for phone, name in matches)
+
+    return "\n".join(lines)
 
 
 @colored_output()
@@ -187,34 +270,95 @@ def show_all(contacts: dict[str, str]) -> str:
 
 @colored_output()
 @input_error
-def execute_command(command: str, args: list[str], contacts: dict[str, str]) -> str:
+@validate_args(
+    required_count=2,
+    validators={0: is_supported_format},
+    error_messages={0: error_invalid_export_format},
+)
+def export_contacts(args: list[str], contacts: dict[str, str]) -> str:
     """
-    Execute a command by dispatching to appropriate handler.
+    Export contacts to a CSV, JSON Lines or vCard file.
+
+    Contacts are streamed to the file in chunks. Optional filters
+    `name=<prefix>` and `phone=<prefix>` limit the exported contacts; the
+    phone prefix is mapped through the phone policy like stored phones.
+    A path ending with ".gz" produces gzip-compressed output.
 
     Args:
-        command: Command name to execute.
-        args: List of arguments for the command.
-        contacts: Dictionary of contacts.
+        args: List of arguments where args[0] is the format (csv, jsonl, vcf),
+              args[1] is the destination path and the rest are optional filters.
+        contacts: Dictionary containing contact information.
 
     Returns:
-        Result string from command execution.
+        Success message with the number of exported contacts, or an error
+        message if a filter is invalid or the file cannot be written.
 
     Raises:
-        KeyError: If command is not recognized.
+        ValueError: If insufficient arguments provided (less than 2).
+
+    Example:
+        >>> contacts = {"John": "0501234567", "Jane": "0987654321"}
+        >>> export_contacts(["csv", "out.csv", "name=jo"], contacts)
+        "Exported 1 contact(s) to out.csv."
     """
-    if not command:  # Empty command
-        return ""
 
-    commands: dict[str, tuple[Callable[..., str], str]] = {
-        "hello": (hello_message, "none"),
-        "add": (add_contact, "args_contacts"),
-        "change": (change_contact, "args_contacts"),
-        "phone": (show_phone, "args_contacts"),
-        "all": (show_all, "contacts"),
-    }
+    fmt, path, *filters = args
+    prefixes: dict[str, str] = {}
+
+    for token in filters:
+        key, sep, value = token.partition("=")
+        if not sep or key.lower() not in ("name", "phone") or not value:
+            return error_invalid_export_filter(token)
+        prefixes[key.lower()] = value
+
+    phone_prefix = prefixes.get("phone")
+    if phone_prefix:
+        phone_prefix = get_phone_policy().canonical_prefix(phone_prefix)
+
+    try:
+        count = write_export(
+            contacts,
+            path,
+            fmt,
+            name_prefix=prefixes.get("name"),
+            phone_prefix=phone_prefix,
+        )
+    except OSError as exc:
+        return error_export_failed(path, exc.strerror or str(exc))
+
+    return EXPORT_SUCCESS.format(count=count, path=path)
+
+
+# Command name -> (handler, calling mode)
+COMMANDS: dict[str, tuple[Callable[..., Any], str]] = {
+    "hello": (hello_message, "none"),
+    "add": (add_contact, "args_contacts"),
+    "change": (change_contact, "args_contacts"),
+    "phone": (show_phone, "args_contacts"),
+    "phones": (find_by_phone_prefix, "args_contacts"),
+    "all": (show_all, "contacts"),
+    "export": (export_contacts, "args_contacts"),
+}
+
+# Read-only commands that may take long on big books; the async path runs
+# them in a worker thread on a snapshot of the contacts
+BACKGROUND_COMMANDS = frozenset({"all", "export"})
+
+# Held by the async path while commands (including awaited coroutine
+# handlers) run on the event loop and while a worker thread copies the
+# contacts, so a copy never sees a half-done change
+_contacts_lock = threading.Lock()
+
+
+def _dispatch(command: str, args: list[str], contacts: dict[str, str]) -> Any:
+    """
+    Call the handler registered for a command.
+
+    Unknown commands return the "Unknown command" message instead of raising.
+    """
 
-    if command in commands:
-        handler, mode = commands[command]
+    if command in COMMANDS:
+        handler, mode = COMMANDS[command]
 
         if mode == "none":
             if args:
@@ -226,4 +370,70 @@ def execute_command(command: str, args: list[str], contacts: dict[str, str]) ->
             return handler(contacts)
         return handler(args, contacts)
 
-    raise KeyError("unknown_command")
+    return UNKNOWN_COMMAND
+
+
+def _dispatch_snapshot(command: str, args: list[str], contacts: dict[str, str]) -> Any:
+    """Copy the contacts under the lock, then call the handler on the copy."""
+
+    with _contacts_lock:
+        snapshot = dict(contacts)
+    return _dispatch(command, args, snapshot)
+
+
+@colored_output()
+@input_error
+def execute_command(command: str, args: list[str], contacts: dict[str, str]) -> str:
+    """
+    Execute a command by dispatching to appropriate handler.
+
+    Args:
+        command: Command name to execute.
+        args: List of arguments for the command.
+        contacts: Dictionary of contacts.
+
+    Returns:
+        Result string from command execution.
+    """
+    if not command:  # Empty command
+        return ""
+
+    return _dispatch(command, args, contacts)
+
+
+@async_colored_output()
+@async_input_error
+async def execute_command_async(
+    command: str, args: list[str], contacts: dict[str, str]
+) -> str:
+    """
+    Execute a command without blocking the event loop.
+
+    Quick commands run inline on the event loop. Commands listed in
+    `BACKGROUND_COMMANDS` run in a worker thread on a snapshot of the
+    contacts, taken in that thread, so they never see concurrent
+    modifications and copying a big book does not block the event loop
+    (an inline command only waits while a copy is being taken).
+    Coroutine handlers registered in `COMMANDS` are awaited while holding
+    the same lock, so they must not wait for a background command.
+
+    Args:
+        command: Command name to execute.
+        args: List of arguments for the command.
+        contacts: Dictionary of contacts.
+
+    Returns:
+        Result string from command execution.
+    """
+    if not command:  # Empty command
+        return ""
+
+    if command in BACKGROUND_COMMANDS:
+        return await asyncio.to_thread(_dispatch_snapshot, command, args, contacts)
+
+    with _contacts_lock:
+        result = _dispatch(command, args, contacts)
+        if inspect.isawaitable(result):
+            result = await result
+
+    return result
@@ -1,9 +1,91 @@
+"""
+Input parser module for the contact assistant bot.
+
+This module turns raw input lines into a command and its arguments:
+- Tokenization with double/single quotes and backslash escapes
+- Argument shaping per command schema (multi-word names are joined once)
+- Batch parsing of many lines
+"""
+
+import re
+from typing import Iterable, Iterator
+
+# Quoted token (closing quote optional) or a bare word with escapes.
+# Quotes only open a token at its start, so "O'Brien" stays one word.
+_TOKEN_RE = re.compile(
+    r'"((?:[^"\\]|\\.)*)"?' r"|'((?:[^'\\]|\\.)*)'?" r"|((?:[^\s\\]|\\.?)+)"
+)
+_ESCAPE_RE = re.compile(r"\\(.)")
+
+# Command name -> argument field names. The "name" field takes all tokens
+# not needed by the other fields, so unquoted multi-word names work.
+COMMAND_SCHEMAS: dict[str, tuple[str, ...]] = {
+    "add": ("name", "phone"),
+    "change": ("name", "phone"),
+    "phone": ("name",),
+}
+
+
+def tokenize(text: str) -> list[str]:
+    """
+    Split text into tokens, honoring quotes and backslash escapes.
+
+    Lines without quotes or backslashes take a fast path via `str.split`.
+
+    Example:
+        >>> tokenize('add "John Smith" 0501234567')
+        ["add", "John Smith", "0501234567"]
+        >>> tokenize("add O'Brien 0501234567")
+        ["add", "O'Brien", "0501234567"]
+    """
+
+    if '"' not in text and "'" not in text and "\\" not in text:
+        return text.split()
+
+    tokens: list[str] = []
+    for match in _TOKEN_RE.finditer(text):
+        token = match.group(match.lastindex or 0)
+        if "\\" in token:
+            token = _ESCAPE_RE.sub(r"\1", token)
+        tokens.append(token)
+
+    return tokens
+
+
+def shape_args(command: str, args: list[str]) -> list[str]:
+    """
+    Arrange tokens into the argument fields of a command schema.
+
+    Extra tokens are joined into the "name" field, so handlers receive
+    exactly one argument per field. Commands without a schema, and
+    argument lists that are too short, are returned unchanged.
+
+    Example:
+        >>> shape_args("add", ["John", "Smith", "0501234567"])
+        ["John Smith", "0501234567"]
+    """
+
+    schema = COMMAND_SCHEMAS.get(command)
+    if not schema or len(args) <= len(schema) or "name" not in schema:
+        return args
+
+    name_index = schema.index("name")
+    name_end = len(args) - (len(schema) - name_index - 1)
+
+    return [
+        *args[:name_index],
+        " ".join(args[name_index:name_end]),
+        *args[name_end:],
+    ]
+
+
 def parse_input(user_input: str) -> tuple[str, list[str]]:
     """
     Parse user input into a command and its arguments.
 
-    Extracts the first word as the command (converted to lowercase) and
-    remaining words as arguments.
+    Extracts the first token as the command (converted to lowercase) and
+    remaining tokens as arguments shaped by the command schema. Quoted
+    arguments keep their spaces.
 
     Args:
         user_input: Raw input string from user. If empty, returns empty command and args.
@@ -14,6 +96,10 @@ def parse_input(user_input: str) -> tuple[str, list[str]]:
     Example:
         >>> parse_input("add John 1234567890")
         ("add", ["John", "1234567890"])
+        >>> parse_input("add John Smith 1234567890")
+        ("add", ["John Smith", "1234567890"])
+        >>> parse_input('phone "John Smith"')
+        ("phone", ["John Smith"])
         >>> parse_input("")
         ("", [])
     """
@@ -21,6 +107,18 @@ def parse_input(user_input: str) -> tuple[str, list[str]]:
     if not user_input or not user_input.strip():
         return "", []
 
-    cmd, *args = user_input.split()
+    tokens = tokenize(user_input)
+    if not tokens:
+        return "", []
+
+    cmd, *args = tokens
+    cmd = cmd.strip().lower()
+
+    return cmd, shape_args(cmd, args)
+
+
+def parse_lines(lines: Iterable[str]) -> Iterator[tuple[str, list[str]]]:
+    """Parse many input lines lazily, e.g. for batch or replay mode."""
 
-    return cmd.strip().lower(), args
+    for line in lines:
+        yield parse_input(line)
@@ -1,17 +1,31 @@
+import argparse
+import asyncio
+from contextlib import nullcontext
+from typing import Optional
+
 from colorama import init
 from input_parser import parse_input
-from handlers import execute_command
+from handlers import BACKGROUND_COMMANDS, execute_command, execute_command_async
+from maintenance import MaintenanceScheduler
+from replay import CommandRecorder
+from phone_index import IndexedContacts
+from phone_policies import get_policy
+from validators import set_phone_policy
 from messages import (
     welcome_message,
     goodbye_message,
     prompt_for_command,
+    set_no_color,
 )
 
 # Initialize colorama for Windows compatibility
 init(autoreset=True)
 
 
-def main() -> None:
+def main(
+    recorder: Optional[CommandRecorder] = None,
+    maintenance: Optional[MaintenanceScheduler] = None,
+) -> None:
     """
     Main CLI loop for the contact assistant bot.
 
@@ -21,30 +35,158 @@ def main() -> None:
     - add <name> <phone>: Add a new contact
     - change <name> <phone>: Update an existing contact's phone
     - phone <name>: Look up a contact's phone number
+    - phones <prefix>: List contacts whose phone starts with prefix
     - all: Display all contacts in a formatted table
+    - export <format> <file> [name=<prefix>] [phone=<prefix>]: Export contacts
     - close/exit: Terminate the program
 
     The bot runs in an infinite loop until the user enters "close" or "exit".
+
+    Args:
+        recorder: Optional recorder capturing every input line with a timestamp.
+        maintenance: Optional scheduler compacting contacts while waiting
+                     for input; commands run under its lock.
     """
 
-    contacts: dict[str, str] = {}
+    contacts = IndexedContacts()
+    if maintenance:
+        maintenance.add_job("contacts", contacts.maintenance_steps)
+        maintenance.start()
+
+    print(welcome_message())
+
+    try:
+        while True:
+            user_input = input(prompt_for_command())
+            if recorder:
+                recorder.record(user_input)
+            command, args = parse_input(user_input)
+
+            if command in ["close", "exit"]:
+                print(goodbye_message())
+                break
+
+            with maintenance.command() if maintenance else nullcontext():
+                result = execute_command(command, args, contacts)
+
+            if result:  # Only print if there's a result
+                print(result)
+    finally:
+        if maintenance:
+            maintenance.stop()
+
+
+async def main_async(recorder: Optional[CommandRecorder] = None) -> None:
+    """
+    Asyncio CLI loop for the contact assistant bot.
+
+    Supports the same commands as `main`. Input is read in a worker thread,
+    so the event loop is never blocked by `input()`. Long read-only commands
+    (see `BACKGROUND_COMMANDS`) run as background tasks and print their
+    result when done, while quick lookups keep being answered. Pending
+    tasks are awaited before the program exits.
+
+    Args:
+        recorder: Optional recorder capturing every input line with a timestamp.
+    """
+
+    contacts: dict[str, str] = IndexedContacts()
+    pending: set[asyncio.Task] = set()
+
+    async def run_and_print(command: str, args: list[str]) -> None:
+        result = await execute_command_async(command, args, contacts)
+        if result:  # Only print if there's a result
+            print(result)
 
     print(welcome_message())
 
     while True:
-        user_input = input(prompt_for_command())
+        try:
+            user_input = await asyncio.to_thread(input, prompt_for_command())
+        except EOFError:
+            user_input = "exit"
+
+        if recorder:
+            recorder.record(user_input)
         command, args = parse_input(user_input)
 
         if command in ["close", "exit"]:
+            if pending:
+                await asyncio.gather(*pending)
             print(goodbye_message())
             break
 
-        result = execute_command(command, args, contacts)
+        if command in BACKGROUND_COMMANDS:
+            task = asyncio.create_task(run_and_print(command, args))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+        else:
+            await run_and_print(command, args)
 
-        if result:  # Only print if there's a result
-            print(result)
+
+def run(
+    use_async: bool,
+    recorder: Optional[CommandRecorder],
+    maintenance: Optional[MaintenanceScheduler] = None,
+) -> None:
+    """
+    Start the sync or async CLI loop.
+
+    Maintenance runs with the sync loop only. The async loop copies contacts
+    in worker threads for background commands, outside the scheduler's lock,
+    so `maintenance` is not used there.
+    """
+
+    if use_async:
+        asyncio.run(main_async(recorder))
+    else:
+        main(recorder, maintenance)
 
 
 # For testing purposes
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Contact assistant bot.")
+    parser.add_argument(
+        "--async", dest="use_async", action="store_true", help="run asyncio loop"
+    )
+    parser.add_argument("--record", metavar="FILE", help="record commands to FILE")
+    parser.add_argument("--no-color", action="store_true", help="disable colors")
+    parser.add_argument(
+        "--phone-policy",
+        metavar="SPEC",
+        type=get_policy,
+        help='phone numbers to accept: "local" (default), "e164" or countries like "UA,PL"',
+    )
+    parser.add_argument(
+        "--maintenance-budget",
+        metavar="MS",
+        type=float,
+        default=5.0,
+        help="max milliseconds of idle-time maintenance per slice "
+        "(0 disables; not used with --async)",
+    )
+    parser.add_argument(
+        "--idle-delay",
+        metavar="SECONDS",
+        type=float,
+        default=1.0,
+        help="seconds without commands before maintenance runs",
+    )
+    options = parser.parse_args()
+
+    scheduler = (
+        MaintenanceScheduler(options.idle_delay, options.maintenance_budget / 1000)
+        if options.maintenance_budget > 0 and not options.use_async
+        else None
+    )
+
+    if options.no_color:
+        set_no_color()
+    if options.phone_policy:
+        set_phone_policy(options.phone_policy)
+
+    if options.record:
+        with open(options.record, "w", encoding="utf-8") as record_file:
+            run(options.use_async, CommandRecorder(record_file), scheduler)
+    else:
+        run(options.use_async, None, scheduler)
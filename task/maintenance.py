@@ -0,0 +1,200 @@
+"""
+Maintenance module for long-running bot sessions.
+
+This module runs housekeeping jobs in a background thread while the bot is
+idle, for example:
+- Merging buffered phone index entries and releasing spare capacity
+- Rebuilding dictionaries that kept their size after many deletions
+
+A job is a function returning an iterator; every `yield` ends one step.
+Commands and job steps share a lock, so a command waits at most for the
+current step. Steps run only after `idle_delay` seconds without commands,
+for at most `budget` seconds per slice. A job interrupted by a command starts
+over, since the data it was working on may have changed.
+
+Usage:
+    scheduler = MaintenanceScheduler(idle_delay=1.0, budget=0.005)
+    scheduler.add_job("contacts", contacts.maintenance_steps)
+    scheduler.start()
+
+    with scheduler.command():
+        execute_command(command, args, contacts)
+
+    scheduler.stop()
+"""
+
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from typing import Callable, Iterator
+
+Job = Callable[[], Iterator[None]]
+
+
+class MaintenanceScheduler:
+    """Run maintenance job steps in idle time between commands."""
+
+    def __init__(
+        self,
+        idle_delay: float = 1.0,
+        budget: float = 0.005,
+        interval: float = 30.0,
+        pause: float = 0.05,
+    ) -> None:
+        """
+        Initialize the scheduler.
+
+        Args:
+            idle_delay: Seconds without commands before maintenance may run.
+            budget: Maximum seconds of job steps per slice.
+            interval: Default seconds between runs of a job.
+            pause: Seconds between slices of the background thread.
+        """
+
+        self.idle_delay = idle_delay
+        self.budget = budget
+        self.interval = interval
+        self.pause = pause
+        self.runs: Counter[str] = Counter()
+        self.failures: Counter[str] = Counter()
+        self.steps = 0
+
+        self._jobs: dict[str, tuple[Job, float]] = {}
+        self._due: dict[str, float] = {}
+        # Paused jobs: (steps, number of commands when paused)
+        self._paused: dict[str, tuple[Iterator[None], int]] = {}
+        self._commands = 0
+        self._last_command = time.monotonic()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def add_job(self, name: str, job: Job, interval: float | None = None) -> None:
+        """
+        Register a job, first run at the next idle slice.
+
+        Args:
+            name: Job name used in `runs` and `failures`.
+            job: Function returning an iterator of steps.
+            interval: Seconds between runs (default: scheduler interval).
+        """
+
+        self._jobs[name] = (job, self.interval if interval is None else interval)
+        self._due[name] = 0.0
+
+    @contextmanager
+    def command(self) -> Iterator[None]:
+        """Run a command exclusively; maintenance waits until it is done."""
+
+        with self._lock:
+            self._commands += 1
+            try:
+                yield
+            finally:
+                self._last_command = time.monotonic()
+
+    def run_pending(self) -> int:
+        """
+        Run due job steps for at most `budget` seconds if the bot is idle.
+
+        Returns:
+            Number of steps run.
+        """
+
+        if not self._lock.acquire(blocking=False):  # a command is running
+            return 0
+
+        try:
+            now = time.monotonic()
+            if now - self._last_command < self.idle_delay:
+                return 0
+
+            deadline = now + self.budget
+            steps = self.steps
+            for name in list(self._jobs):
+                while time.monotonic() < deadline:
+                    if not self._step(name):
+                        break
+                else:
+                    break
+            return self.steps - steps
+        finally:
+            self._lock.release()
+
+    def _step(self, name: str) -> bool:
+        """
+        Run one step of a job, starting it if it is due.
+
+        Returns:
+            True if a step ran and the job has more steps.
+        """
+
+        job, interval = self._jobs[name]
+        steps, commands = self._paused.pop(name, (None, self._commands))
+
+        if steps is not None and commands != self._commands:
+            steps.close()  # data changed since the job was paused
+            steps = None
+        if steps is None:
+            if time.monotonic() < self._due[name]:
+                return False
+            steps = job()
+
+        self.steps += 1
+        try:
+            next(steps)
+        except StopIteration:
+            self._finish(name, interval)
+            self.runs[name] += 1
+            return False
+        except Exception:  # pylint: disable=broad-exception-caught
+            # Keep the bot running; the job is retried at its next run
+            self._finish(name, interval)
+            self.failures[name] += 1
+            return False
+
+        self._paused[name] = (steps, self._commands)
+        return True
+
+    def _finish(self, name: str, interval: float) -> None:
+        """Schedule the next run of a finished job."""
+
+        self._due[name] = time.monotonic() + interval
+
+    def start(self) -> None:
+        """Start the background thread."""
+
+        if self._thread is not None:
+            return
+
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="maintenance", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self) -> None:
+        """Run slices until stopped."""
+
+        while not self._stop.wait(self.pause):
+            self.run_pending()
+
+    def stop(self) -> None:
+        """Stop the background thread and drop paused jobs."""
+
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+        for steps, _ in self._paused.values():
+            steps.close()
+        self._paused = {}
+
+    def __enter__(self) -> "MaintenanceScheduler":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
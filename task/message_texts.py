@@ -6,7 +6,9 @@ INPUT_ERROR_MISSING_ARGS = "Give me name and phone please."
 INPUT_ERROR_CONTACT_NOT_FOUND = "Contact not found."
 INPUT_ERROR_ENTER_NAME = "Enter user name."
 
-UNKNOWN_COMMAND = "Unknown command. Try: hello, add, change, phone, all, close, exit"
+UNKNOWN_COMMAND = (
+    "Unknown command. Try: hello, add, change, phone, phones, all, export, close, exit"
+)
 
 WELCOME_MESSAGE = "Welcome to the assistant bot!"
 HELLO_MESSAGE = "How can I help you?"
@@ -23,9 +25,23 @@ INVALID_NAME_FORMAT = (
     "Invalid name format. Use letters with optional spaces, hyphens, or apostrophes."
 )
 INVALID_PHONE_FORMAT = (
-    "Invalid phone format. Use local number (10 digits, no spaces).\n"
-    "Examples: 0501234567 | 050-123-4567 | (050)123-4567"
+    "Invalid phone format. Use local number (10 digits, no spaces), or an\n"
+    "international one if the phone policy allows it.\n"
+    "Examples: 0501234567 | 050-123-4567 | (050)123-4567 | +380501234567"
+)
+INVALID_PHONE_PREFIX = (
+    "Invalid phone prefix. Use 1 to 15 digits, e.g. 050, 050-123 or +380."
 )
 INVALID_ARGUMENT_FORMAT = "Invalid format for argument {arg_index}."
 
 PHONE_NOT_FOUND_IN_RECORD = "Phone number {phone} not found in record"
+RECORD_IN_OTHER_BOOK = (
+    "Record {name} belongs to another address book; delete it there first"
+)
+
+EXPORT_SUCCESS = "Exported {count} contact(s) to {path}."
+EXPORT_FAILED = "Error: could not write export file {path}: {reason}"
+INVALID_EXPORT_FORMAT = "Invalid export format. Use one of: csv, jsonl, vcf."
+INVALID_EXPORT_FILTER = (
+    "Invalid export filter '{token}'. Use name=<prefix> or phone=<prefix>."
+)
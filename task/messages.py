@@ -5,13 +5,22 @@ This module provides user-friendly message functions with formatting:
 - Greeting messages
 - Error messages
 - Command prompts
+
+Styled messages are rendered once per theme by `MessageRenderer`, so
+message functions only look up a precomputed string (or format a
+precomputed template). Theme and no-color mode can be switched at runtime
+with `set_theme` and `set_no_color`.
 """
 
-from decorators import output_formatter
-from colorama import Fore
+from functools import lru_cache
+from typing import Callable, Optional
+
+from colorama import Fore, Style
+from decorators import set_color_enabled
 from message_texts import (
     INVALID_NAME_FORMAT,
     INVALID_PHONE_FORMAT,
+    INVALID_PHONE_PREFIX,
     WELCOME_MESSAGE,
     HELLO_MESSAGE,
     GOODBYE_MESSAGE,
@@ -19,61 +28,188 @@ from message_texts import (
     PROMPT_FOR_ARGUMENT,
     PROMPT_FOR_COMMAND,
     NO_CONTACTS_FOUND,
+    EXPORT_FAILED,
+    INVALID_EXPORT_FORMAT,
+    INVALID_EXPORT_FILTER,
 )
 
+# Message key -> text constant or template
+MESSAGE_TEXTS: dict[str, str] = {
+    "welcome": WELCOME_MESSAGE,
+    "hello": HELLO_MESSAGE,
+    "goodbye": GOODBYE_MESSAGE,
+    "unexpected_arguments": ERROR_UNEXPECTED_ARGUMENTS,
+    "invalid_name_format": INVALID_NAME_FORMAT,
+    "invalid_phone_format": INVALID_PHONE_FORMAT,
+    "invalid_phone_prefix": INVALID_PHONE_PREFIX,
+    "prompt_for_argument": PROMPT_FOR_ARGUMENT,
+    "prompt_for_command": PROMPT_FOR_COMMAND,
+    "no_contacts_found": NO_CONTACTS_FOUND,
+    "invalid_export_format": INVALID_EXPORT_FORMAT,
+    "invalid_export_filter": INVALID_EXPORT_FILTER,
+    "export_failed": EXPORT_FAILED,
+}
+
+# Message key -> (color, bold)
+DEFAULT_THEME: dict[str, tuple[str, bool]] = {
+    "welcome": (Fore.CYAN, True),
+    "hello": (Fore.GREEN, False),
+    "goodbye": (Fore.CYAN, False),
+    "unexpected_arguments": (Fore.RED, False),
+    "invalid_name_format": (Fore.RED, False),
+    "invalid_phone_format": (Fore.RED, False),
+    "invalid_phone_prefix": (Fore.RED, False),
+    "prompt_for_argument": (Fore.YELLOW, False),
+    "prompt_for_command": (Fore.YELLOW, False),
+    "no_contacts_found": (Fore.BLUE, False),
+    "invalid_export_format": (Fore.RED, False),
+    "invalid_export_filter": (Fore.RED, False),
+    "export_failed": (Fore.RED, False),
+}
+
+TEMPLATE_CACHE_SIZE = 256
+
+
+class MessageRenderer:
+    """Precomputed styled messages for the current theme."""
+
+    def __init__(
+        self,
+        theme: Optional[dict[str, tuple[str, bool]]] = None,
+        use_color: bool = True,
+    ) -> None:
+        """Initialize renderer and precompute all messages."""
+
+        self.theme: dict[str, tuple[str, bool]] = dict(DEFAULT_THEME)
+        self.use_color: bool = use_color
+        self._styled: dict[str, str] = {}
+        self.format: Callable[..., str] = self._format
+        self.configure(theme)
+
+    def configure(
+        self,
+        theme: Optional[dict[str, tuple[str, bool]]] = None,
+        use_color: Optional[bool] = None,
+    ) -> None:
+        """
+        Update theme overrides and/or color mode and re-render all messages.
+
+        Args:
+            theme: Message key -> (color, bold) overrides merged into the theme.
+            use_color: When False, messages are rendered without any styling.
+        """
+
+        if theme:
+            self.theme.update(theme)
+        if use_color is not None:
+            self.use_color = use_color
+
+        self._styled = {
+            key: self._style(key, text) for key, text in MESSAGE_TEXTS.items()
+        }
+        self.format = lru_cache(maxsize=TEMPLATE_CACHE_SIZE)(self._format)
+
+    def _style(self, key: str, text: str) -> str:
+        """Wrap text in the theme style of a message key."""
+
+        if not self.use_color:
+            return text
+
+        color, bold = self.theme[key]
+        style = Style.BRIGHT if bold else ""
+        return f"{style}{color}{text}{Style.RESET_ALL}"
+
+    def render(self, key: str) -> str:
+        """Return the precomputed styled message."""
+
+        return self._styled[key]
+
+    def _format(self, key: str, **kwargs: str) -> str:
+        """Fill a precomputed styled template with arguments."""
+
+        return self._styled[key].format(**kwargs)
+
+
+_renderer = MessageRenderer()
+
+
+def set_theme(theme: dict[str, tuple[str, bool]]) -> None:
+    """Override message colors, e.g. {"hello": (Fore.MAGENTA, True)}."""
+
+    _renderer.configure(theme=theme)
+
+
+def set_no_color(no_color: bool = True) -> None:
+    """Turn all message and handler output styling off or back on."""
+
+    _renderer.configure(use_color=not no_color)
+    set_color_enabled(not no_color)
+
 
-@output_formatter(color=Fore.CYAN, bold=True)
 def welcome_message() -> str:
     """Return welcome message for the assistant bot."""
-    return WELCOME_MESSAGE
+    return _renderer.render("welcome")
 
 
-@output_formatter(color=Fore.GREEN)
 def hello_message() -> str:
     """Return greeting message."""
-    return HELLO_MESSAGE
+    return _renderer.render("hello")
 
 
-@output_formatter(color=Fore.CYAN)
 def goodbye_message() -> str:
     """Return goodbye message."""
-    return GOODBYE_MESSAGE
+    return _renderer.render("goodbye")
 
 
-@output_formatter(color=Fore.RED)
 def error_unexpected_arguments(command: str) -> str:
     """Return error message when a command receives unexpected arguments."""
-    return ERROR_UNEXPECTED_ARGUMENTS.format(command=command)
+    return _renderer.format("unexpected_arguments", command=command)
 
 
-@output_formatter(color=Fore.RED)
 def error_invalid_name_format() -> str:
     """Return error message for invalid name format."""
-    return INVALID_NAME_FORMAT
+    return _renderer.render("invalid_name_format")
 
 
-@output_formatter(color=Fore.RED)
 def error_invalid_phone_format() -> str:
     """Return error message for invalid phone format."""
-    return INVALID_PHONE_FORMAT
+    return _renderer.render("invalid_phone_format")
+
+
+def error_invalid_phone_prefix() -> str:
+    """Return error message for invalid phone prefix."""
+    return _renderer.render("invalid_phone_prefix")
 
 
-@output_formatter(color=Fore.YELLOW)
 def prompt_for_argument(arg_description: str, command: str) -> str:
     """Return prompt message for requesting a specific argument."""
-    return PROMPT_FOR_ARGUMENT.format(
+    return _renderer.format(
+        "prompt_for_argument",
         arg_description=arg_description,
         command=command,
     )
 
 
-@output_formatter(color=Fore.YELLOW)
 def prompt_for_command() -> str:
     """Return prompt message for requesting a command."""
-    return PROMPT_FOR_COMMAND
+    return _renderer.render("prompt_for_command")
 
 
-@output_formatter(color=Fore.BLUE)
 def no_contacts_found_message() -> str:
     """Return message when there are no contacts."""
-    return NO_CONTACTS_FOUND
+    return _renderer.render("no_contacts_found")
+
+
+def error_invalid_export_format() -> str:
+    """Return error message for unsupported export format."""
+    return _renderer.render("invalid_export_format")
+
+
+def error_invalid_export_filter(token: str) -> str:
+    """Return error message for an unrecognized export filter."""
+    return _renderer.format("invalid_export_filter", token=token)
+
+
+def error_export_failed(path: str, reason: str) -> str:
+    """Return error message when the export file cannot be written."""
+    return _renderer.format("export_failed", path=path, reason=reason)
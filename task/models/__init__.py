@@ -1,6 +1,17 @@
 """Address book models package."""
 
 from .address_book import AddressBook
+from .events import (
+    Event,
+    EventBus,
+    EventsDropped,
+    EventStream,
+    PhoneAdded,
+    PhoneEdited,
+    PhoneRemoved,
+    RecordAdded,
+    RecordDeleted,
+)
 from .exceptions import (
     AddressBookError,
     FieldError,
@@ -8,22 +19,39 @@ from .exceptions import (
     InvalidPhoneError,
     PhoneNotFoundError,
     RecordError,
+    RecordInOtherBookError,
 )
 from .field import Field
 from .name import Name
+from .name_table import NameTable
 from .phone import Phone
 from .record import Record
+from .result import PHONE_NOT_FOUND, RECORD_NOT_FOUND, Result
 
 __all__ = [
     "AddressBook",
     "AddressBookError",
+    "Event",
+    "EventBus",
+    "EventStream",
+    "EventsDropped",
     "Field",
     "FieldError",
     "InvalidNameError",
     "InvalidPhoneError",
     "Name",
+    "NameTable",
+    "PHONE_NOT_FOUND",
     "Phone",
+    "PhoneAdded",
+    "PhoneEdited",
     "PhoneNotFoundError",
+    "PhoneRemoved",
+    "RECORD_NOT_FOUND",
     "Record",
+    "RecordAdded",
+    "RecordDeleted",
     "RecordError",
+    "RecordInOtherBookError",
+    "Result",
 ]
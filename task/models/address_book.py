@@ -1,25 +1,219 @@
 """AddressBook class for storing and managing contact records."""
 
 from collections import UserDict
+from itertools import islice
+from typing import Any, Iterator
 
+from task.message_texts import RECORD_IN_OTHER_BOOK
+from task.phone_index import PhoneIndex
+from task.phone_policies import DEFAULT_POLICY, PhonePolicy
+
+from .events import EventBus, RecordAdded, RecordDeleted
+from .exceptions import RecordInOtherBookError
+from .name_table import NameTable
 from .record import Record
+from .result import RECORD_NOT_FOUND, Result
+
+# Deletions before maintenance rebuilds `data` (dicts do not shrink on deletion)
+COMPACT_MIN_REMOVALS = 256
+COMPACT_CHUNK_SIZE = 2_000
 
 
 class AddressBook(UserDict):
     """Class for storing records and managing contacts."""
 
+    def __init__(
+        self, *args: Any, policy: PhonePolicy | None = None, **kwargs: Any
+    ) -> None:
+        """
+        Initialize address book with an empty phone index.
+
+        Args:
+            policy: Phone policy of all records (local numbers by default),
+                    e.g. `get_policy("UA,PL")` for international contacts.
+        """
+
+        # Name ids are optional, so the table is built on first use
+        self._names: NameTable | None = None
+        self.phone_index: PhoneIndex = PhoneIndex()
+        self.policy: PhonePolicy = policy or DEFAULT_POLICY
+        # Change events of the book and its records (see `EventBus`)
+        self.events: EventBus = EventBus()
+        self._removed = 0
+        super().__init__(*args, **kwargs)
+
+    def copy(self) -> "AddressBook":
+        """
+        Return a book with copies of the records.
+
+        The copy has its own phone index, events and name table, so changes
+        to either book or its records do not show up in the other.
+        """
+
+        book = self.__class__(policy=self.policy)
+        for key, record in self.data.items():
+            book[key] = record.copy()
+        return book
+
+    def __copy__(self) -> "AddressBook":
+        return self.copy()
+
+    @property
+    def names(self) -> NameTable:
+        """Table of stored names with integer ids, built on first use."""
+
+        if self._names is None:
+            self._names = NameTable()
+            for key in self.data:
+                self._names.add(key)
+        return self._names
+
+    def __setitem__(self, key: str, record: Record) -> None:
+        """
+        Store a record under its canonical name and index its phones.
+
+        Raises:
+            InvalidPhoneError: If a phone of the record is not valid under the
+                               book's phone policy.
+            RecordInOtherBookError: If the record is stored in another book
+                                    (add a `copy()` of it instead).
+        """
+
+        index = record.phone_index
+        if index is not None and index is not self.phone_index:
+            raise RecordInOtherBookError(
+                RECORD_IN_OTHER_BOOK.format(name=record.name.value)
+            )
+        if record.policy is not self.policy:
+            record.set_policy(self.policy)
+
+        old_record = self.data.get(key)
+        if old_record is not None and old_record.name.value == key:
+            key = old_record.name.value  # the dict keeps its existing key
+        if record.name.value == key:
+            # Share one copy of the name between the key and the record
+            record.name.value = key
+        if self._names is not None:
+            self._names.add(key)
+
+        if old_record is not record:
+            if old_record is not None:
+                self._unindex(old_record)
+            record.phone_index = self.phone_index
+            record.events = self.events
+            for phone in record.phones:
+                self.phone_index.add(phone.value, record.name.value)
+
+        self.data[key] = record
+
+        if old_record is not record and self.events:
+            with self.events.batch():
+                if old_record is not None:
+                    self.events.emit(RecordDeleted(key))
+                self.events.emit(
+                    RecordAdded(key, tuple(p.value for p in record.phones))
+                )
+
+    def __delitem__(self, key: str) -> None:
+        """Delete a record, release its name and drop its phones from the index."""
+
+        record = self.data.pop(key)
+        self._unindex(record)
+        if self._names is not None:
+            self._names.discard(key)
+        self._removed += 1
+
+        if self.events:
+            self.events.emit(RecordDeleted(key))
+
+    def _unindex(self, record: Record) -> None:
+        """Remove a record's phones from the index and detach it."""
+
+        for phone in record.phones:
+            self.phone_index.remove(phone.value, record.name.value)
+        record.phone_index = None
+        record.events = None
+
     def add_record(self, record: Record) -> None:
         """Add a record to the address book."""
 
-        self.data[record.name.value] = record
+        self[record.name.value] = record
 
     def find(self, name: str) -> Record | None:
         """Find a record by name."""
 
         return self.data.get(name)
 
+    def lookup(self, name: str) -> Result:
+        """Find a record by name, returning a `Result` instead of None."""
+
+        record = self.data.get(name)
+        if record is None:
+            return RECORD_NOT_FOUND
+        return Result(record)
+
+    def find_by_id(self, name_id: int) -> Record | None:
+        """Find a record by its name id (see `name_id`)."""
+
+        try:
+            return self.data.get(self.names[name_id])
+        except (IndexError, KeyError):
+            return None
+
+    def name_id(self, name: str) -> int | None:
+        """Return the integer id of a stored name, building the name table once."""
+
+        return self.names.get_id(name)
+
+    def find_by_phone_prefix(self, prefix: str) -> list[tuple[str, str]]:
+        """
+        Return (phone, name) pairs whose phone starts with prefix, sorted by phone.
+
+        The prefix is mapped through the book's phone policy, so "050" finds
+        "+380501234567" in a UA book.
+        """
+
+        return self.phone_index.prefix(self.policy.canonical_prefix(prefix))
+
+    def find_by_phone_range(self, low: str, high: str) -> list[tuple[str, str]]:
+        """
+        Return (phone, name) pairs with low <= phone <= high, sorted by phone.
+
+        Bounds are compared in canonical form when the phone policy accepts
+        them, like stored phones.
+        """
+
+        return self.phone_index.range(
+            self.policy.normalize(low) or low, self.policy.normalize(high) or high
+        )
+
     def delete(self, name: str) -> None:
         """Delete a record by name."""
 
         if name in self.data:
-            del self.data[name]
+            del self[name]
+
+    def maintenance_steps(self, chunk_size: int = COMPACT_CHUNK_SIZE) -> Iterator[None]:
+        """
+        Compact the phone index, then rebuild `data` after many deletions.
+
+        The new dictionary is filled `chunk_size` records per step and swapped
+        in at the end. Yields between steps, so a `MaintenanceScheduler` can
+        pause the work; the book must not change until the steps are done
+        (the scheduler restarts interrupted jobs). Name ids are kept, since
+        callers may hold them.
+        """
+
+        yield from self.phone_index.compact_steps(chunk_size)
+
+        if self._removed < max(COMPACT_MIN_REMOVALS, len(self.data) // 4):
+            return
+
+        data: dict[str, Record] = {}
+        items = iter(self.data.items())
+        while chunk := list(islice(items, chunk_size)):
+            data.update(chunk)
+            yield
+
+        self.data = data
+        self._removed = 0
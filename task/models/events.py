@@ -0,0 +1,242 @@
+"""Change events of address books and records, with callbacks and streams."""
+
+import asyncio
+import threading
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Iterator, NamedTuple, Union
+
+DEFAULT_QUEUE_SIZE = 10_000
+DEFAULT_MAX_BATCH = 500
+
+
+class RecordAdded(NamedTuple):
+    """A record was stored in the book."""
+
+    name: str
+    phones: tuple[str, ...]
+
+
+class RecordDeleted(NamedTuple):
+    """A record was removed from the book (also before it is replaced)."""
+
+    name: str
+
+
+class PhoneAdded(NamedTuple):
+    """A phone was added to a record."""
+
+    name: str
+    phone: str
+
+
+class PhoneEdited(NamedTuple):
+    """A phone of a record was changed."""
+
+    name: str
+    old_phone: str
+    new_phone: str
+
+
+class PhoneRemoved(NamedTuple):
+    """A phone was removed from a record."""
+
+    name: str
+    phone: str
+
+
+class EventsDropped(NamedTuple):
+    """
+    A stream was full and dropped events.
+
+    Events after the last delivered one were lost, so a consumer should
+    rebuild its state from the book before handling further events.
+    """
+
+    count: int
+
+
+Event = Union[
+    RecordAdded, RecordDeleted, PhoneAdded, PhoneEdited, PhoneRemoved, EventsDropped
+]
+Callback = Callable[[list[Event]], None]
+
+
+class EventBus:
+    """
+    Deliver change events to callbacks and streams.
+
+    Events are delivered in batches: one event per batch by default, or all
+    events of a `batch()` block at once. An empty bus is falsy, so emitters
+    skip building events nobody listens to.
+    """
+
+    def __init__(self) -> None:
+        """Initialize a bus without subscribers."""
+
+        self._callbacks: list[Callback] = []
+        self._streams: list["EventStream"] = []
+        self._pending: list[Event] | None = None
+
+    def subscribe(self, callback: Callback) -> Callable[[], None]:
+        """
+        Call a function with every batch of events.
+
+        Exceptions of callbacks propagate to the code changing the book,
+        after the change has been made.
+
+        Returns:
+            Function that unsubscribes the callback.
+        """
+
+        self._callbacks.append(callback)
+        return lambda: self._callbacks.remove(callback)
+
+    def stream(
+        self, maxsize: int = DEFAULT_QUEUE_SIZE, max_batch: int = DEFAULT_MAX_BATCH
+    ) -> "EventStream":
+        """
+        Open a bounded stream of events, read with `async for` or `get_batch`.
+
+        Args:
+            maxsize: Queued events before the stream drops new ones.
+            max_batch: Largest batch returned at once.
+        """
+
+        stream = EventStream(self, maxsize, max_batch)
+        self._streams.append(stream)
+        return stream
+
+    def emit(self, event: Event) -> None:
+        """Deliver an event, or hold it until the current batch ends."""
+
+        if self._pending is not None:
+            self._pending.append(event)
+        else:
+            self._deliver([event])
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Collect events of a block and deliver them as one batch."""
+
+        if self._pending is not None:  # nested: the outer block delivers
+            yield
+            return
+
+        self._pending = []
+        try:
+            yield
+        finally:
+            events, self._pending = self._pending, None
+            if events:
+                self._deliver(events)
+
+    def _deliver(self, events: list[Event]) -> None:
+        """Put events into streams, then call callbacks."""
+
+        for stream in self._streams:
+            stream.put(events)
+        for callback in list(self._callbacks):
+            callback(events)
+
+    def _close_stream(self, stream: "EventStream") -> None:
+        """Stop delivering to a stream."""
+
+        if stream in self._streams:
+            self._streams.remove(stream)
+
+    def __bool__(self) -> bool:
+        """Return True if anyone listens."""
+
+        return bool(self._callbacks or self._streams)
+
+
+class EventStream:
+    """
+    Bounded queue of events from an `EventBus`.
+
+    When the queue is full, new events are dropped until the consumer has
+    read the queued ones; it then receives `EventsDropped` as a signal to
+    resynchronize. Events are put by the thread changing the book, one at a
+    time, so a drop is ordered with the changes; the consumer may read from
+    an event loop in another thread.
+    """
+
+    def __init__(self, bus: EventBus, maxsize: int, max_batch: int) -> None:
+        """Initialize an empty stream (use `EventBus.stream`)."""
+
+        self._bus = bus
+        self.maxsize = maxsize
+        self.max_batch = max_batch
+        self.closed = False
+        self._events: deque[Event] = deque()
+        self._dropped = 0
+        self._lock = threading.Lock()
+        self._waiter: asyncio.Future | None = None
+
+    def put(self, events: list[Event]) -> None:
+        """Queue events, dropping them if the stream is full."""
+
+        with self._lock:
+            for event in events:
+                if self._dropped or len(self._events) >= self.maxsize:
+                    self._dropped += 1
+                else:
+                    self._events.append(event)
+            waiter, self._waiter = self._waiter, None
+
+        if waiter is not None:
+            waiter.get_loop().call_soon_threadsafe(_wake, waiter)
+
+    def get_batch(self) -> list[Event]:
+        """Return up to `max_batch` queued events without waiting."""
+
+        with self._lock:
+            count = min(len(self._events), self.max_batch)
+            batch = [self._events.popleft() for _ in range(count)]
+            if not self._events and self._dropped and len(batch) < self.max_batch:
+                batch.append(EventsDropped(self._dropped))
+                self._dropped = 0
+        return batch
+
+    def close(self) -> None:
+        """Stop receiving events; iteration ends once the queue is read."""
+
+        self._bus._close_stream(self)  # pylint: disable=protected-access
+        with self._lock:
+            self.closed = True
+            waiter, self._waiter = self._waiter, None
+        if waiter is not None:
+            waiter.get_loop().call_soon_threadsafe(_wake, waiter)
+
+    def __aiter__(self) -> "EventStream":
+        return self
+
+    async def __anext__(self) -> list[Event]:
+        """Wait for the next batch of events."""
+
+        while True:
+            batch = self.get_batch()
+            if batch:
+                return batch
+
+            with self._lock:
+                if self._events or self._dropped:
+                    continue
+                if self.closed:
+                    raise StopAsyncIteration
+                waiter = asyncio.get_running_loop().create_future()
+                self._waiter = waiter
+            await waiter
+
+    def __len__(self) -> int:
+        """Return number of queued events."""
+
+        return len(self._events)
+
+
+def _wake(waiter: asyncio.Future) -> None:
+    """Resolve a waiter unless it was cancelled."""
+
+    if not waiter.done():
+        waiter.set_result(None)
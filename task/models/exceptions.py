@@ -29,3 +29,7 @@ class RecordError(AddressBookError):
 
 class PhoneNotFoundError(RecordError):
     """Raised when a phone number is not found in a record."""
+
+
+class RecordInOtherBookError(RecordError):
+    """Raised when a record is added while it belongs to another address book."""
@@ -0,0 +1,68 @@
+"""NameTable class for canonical, id-addressed contact names."""
+
+
+class NameTable:
+    """
+    Interned storage of contact names addressed by integer ids.
+
+    Every distinct name is stored once, as the same string object used as
+    the AddressBook key and as the record's `Name.value`, and can be
+    referenced elsewhere by its integer id. Ids of removed names are reused.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty name table."""
+
+        self._names: list[str | None] = []
+        self._ids: dict[str, int] = {}
+        self._free: list[int] = []
+
+    def add(self, name: str) -> int:
+        """Return the id of a name, storing it first if it is new."""
+
+        name_id = self._ids.get(name)
+        if name_id is not None:
+            return name_id
+
+        if self._free:
+            name_id = self._free.pop()
+            self._names[name_id] = name
+        else:
+            name_id = len(self._names)
+            self._names.append(name)
+
+        self._ids[name] = name_id
+        return name_id
+
+    def get_id(self, name: str) -> int | None:
+        """Return the id of a name, or None if it is not stored."""
+
+        return self._ids.get(name)
+
+    def discard(self, name: str) -> None:
+        """Remove a name from the table; its id becomes free for reuse."""
+
+        name_id = self._ids.pop(name, None)
+        if name_id is not None:
+            self._names[name_id] = None
+            self._free.append(name_id)
+
+    def __getitem__(self, name_id: int) -> str:
+        """Return the name stored under an id."""
+
+        if name_id < 0:  # not a position from the end
+            raise KeyError(name_id)
+        name = self._names[name_id]
+        if name is None:
+            raise KeyError(name_id)
+        return name
+
+    def __contains__(self, name: object) -> bool:
+        """Check whether a name is stored."""
+
+        return name in self._ids
+
+    def __len__(self) -> int:
+        """Return the number of stored names."""
+
+        return len(self._ids)
@@ -1,9 +1,7 @@
 """Phone field class for phone numbers."""
 
-import re
-
 from task.message_texts import INVALID_PHONE_FORMAT
-from task.validators import is_valid_phone
+from task.phone_policies import DEFAULT_POLICY, PhonePolicy
 
 from .exceptions import InvalidPhoneError
 from .field import Field
@@ -11,26 +9,20 @@ from .field import Field
 
 # pylint: disable=too-few-public-methods
 class Phone(Field):
-    """Class for storing phone numbers with validation (local 10 digits)."""
+    """Class for storing phone numbers with validation by a phone policy."""
 
-    def __init__(self, value: str) -> None:
+    def __init__(self, value: str, policy: PhonePolicy | None = None) -> None:
         """Initialize phone field with validation and normalization."""
 
-        # First validate the input format (local only)
-        if not is_valid_phone(value):
+        # Validate and normalize with a single match of the policy
+        normalized = self._normalize(value, policy or DEFAULT_POLICY)
+        if normalized is None:
             raise InvalidPhoneError(INVALID_PHONE_FORMAT)
 
-        # Then normalize it to local format (10 digits)
-        normalized: str = self._normalize(value)
         super().__init__(normalized)
 
     @staticmethod
-    def _normalize(phone: str) -> str:
-        """Extract digits to get local format (10 digits)."""
-
-        if not isinstance(phone, str):
-            return ""
-
-        digits_only: str = re.sub(r"\D", "", phone)
+    def _normalize(phone: str, policy: PhonePolicy) -> str | None:
+        """Return the canonical compact form (e.g. 0501234567 or +380501234567)."""
 
-        return digits_only
+        return policy.normalize(phone)
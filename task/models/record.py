@@ -1,48 +1,129 @@
 """Record class for storing contact information."""
 
 from task.message_texts import PHONE_NOT_FOUND_IN_RECORD
+from task.phone_index import PhoneIndex
+from task.phone_policies import DEFAULT_POLICY, PhonePolicy
 
+from .events import EventBus, PhoneAdded, PhoneEdited, PhoneRemoved
 from .exceptions import PhoneNotFoundError
 from .name import Name
 from .phone import Phone
+from .result import PHONE_NOT_FOUND, Result
 
 
 class Record:
     """Class for storing contact information including name and list of phones."""
 
-    def __init__(self, name: str) -> None:
-        """Initialize record with contact name."""
+    def __init__(self, name: str, policy: PhonePolicy | None = None) -> None:
+        """Initialize record with contact name and phone policy."""
 
         self.name: Name = Name(name)
         self.phones: list[Phone] = []
+        self.policy: PhonePolicy = policy or DEFAULT_POLICY
+        # Index of the AddressBook holding this record, kept in sync on edits
+        self.phone_index: PhoneIndex | None = None
+        # Events of phone changes (the AddressBook's bus once added to a book)
+        self.events: EventBus | None = None
+
+    def copy(self) -> "Record":
+        """Return a record with the same name, phones and policy, in no book."""
+
+        record = Record(self.name.value, self.policy)
+        record.phones = list(self.phones)
+        return record
+
+    def __copy__(self) -> "Record":
+        return self.copy()
 
     def add_phone(self, phone: str) -> None:
         """Add a phone number to the record."""
 
-        self.phones.append(Phone(phone))
+        new_phone = Phone(phone, self.policy)
+        self.phones.append(new_phone)
+
+        if self.phone_index is not None:
+            self.phone_index.add(new_phone.value, self.name.value)
+        if self.events:
+            self.events.emit(PhoneAdded(self.name.value, new_phone.value))
+
+    def set_policy(self, policy: PhonePolicy) -> None:
+        """
+        Switch to another phone policy, converting phones to its canonical form.
+
+        Raises:
+            InvalidPhoneError: If a phone is not valid under the new policy.
+                               The record is left unchanged.
+        """
+
+        old_phones = self.phones
+        phones = [Phone(p.value, policy) for p in old_phones]
+
+        if self.phone_index is not None:
+            for old, new in zip(old_phones, phones):
+                self.phone_index.remove(old.value, self.name.value)
+                self.phone_index.add(new.value, self.name.value)
+        self.phones = phones
+        self.policy = policy
+
+        if self.events:
+            with self.events.batch():
+                for old, new in zip(old_phones, phones):
+                    if old.value != new.value:
+                        self.events.emit(
+                            PhoneEdited(self.name.value, old.value, new.value)
+                        )
+
+    def _canonical(self, phone: str) -> str:
+        """Return the canonical form of a phone, or the phone itself if invalid."""
+
+        return self.policy.normalize(phone) or phone
 
     def remove_phone(self, phone: str) -> None:
         """Remove a phone number from the record."""
 
-        self.phones = [p for p in self.phones if p.value != phone]
+        phone = self._canonical(phone)
+        phones = [p for p in self.phones if p.value != phone]
+        if len(phones) == len(self.phones):
+            return
+
+        if self.phone_index is not None:
+            for _ in range(len(self.phones) - len(phones)):
+                self.phone_index.remove(phone, self.name.value)
+        self.phones = phones
+
+        if self.events:
+            self.events.emit(PhoneRemoved(self.name.value, phone))
 
     def edit_phone(self, old_phone: str, new_phone: str) -> None:
         """Edit an existing phone number in the record."""
 
-        phone_found: bool = False
+        if not self.try_edit_phone(old_phone, new_phone).ok:
+            raise PhoneNotFoundError(PHONE_NOT_FOUND_IN_RECORD.format(phone=old_phone))
 
+    def try_edit_phone(self, old_phone: str, new_phone: str) -> Result:
+        """Edit a phone number, returning a `Result` instead of raising on a miss."""
+
+        old_phone = self._canonical(old_phone)
         for i, phone in enumerate(self.phones):
             if phone.value == old_phone:
-                self.phones[i] = Phone(new_phone)
-                phone_found = True
-                break
+                self.phones[i] = Phone(new_phone, self.policy)
 
-        if not phone_found:
-            raise PhoneNotFoundError(PHONE_NOT_FOUND_IN_RECORD.format(phone=old_phone))
+                if self.phone_index is not None:
+                    self.phone_index.remove(old_phone, self.name.value)
+                    self.phone_index.add(self.phones[i].value, self.name.value)
+                if self.events:
+                    self.events.emit(
+                        PhoneEdited(self.name.value, old_phone, self.phones[i].value)
+                    )
+
+                return Result(self.phones[i])
+
+        return PHONE_NOT_FOUND
 
     def find_phone(self, phone: str) -> str | None:
         """Find and return a phone number if it exists in the record."""
 
+        phone = self._canonical(phone)
         for p in self.phones:
             if p.value == phone:
                 return p.value
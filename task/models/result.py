@@ -0,0 +1,26 @@
+"""Result type for address book lookups that may miss."""
+
+from typing import Any, NamedTuple
+
+
+class Result(NamedTuple):
+    """
+    Outcome of an operation that can fail without raising.
+
+    A successful result carries a value and no error. A failed result
+    carries an error code; failures for common misses are preallocated
+    module constants, so returning them costs no allocation.
+    """
+
+    value: Any = None
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Return True if the operation succeeded."""
+
+        return self.error is None
+
+
+RECORD_NOT_FOUND = Result(error="record_not_found")
+PHONE_NOT_FOUND = Result(error="phone_not_found")
@@ -0,0 +1,388 @@
+"""
+Phone index module for the address book.
+
+This module keeps all phone numbers in sorted order for fast queries:
+- Prefix queries ("all numbers starting with 050123")
+- Range queries ("numbers between X and Y")
+
+Phones are packed into integers stored in a sorted array, with owner names
+in a parallel list. A key holds the digits left-aligned in 15 positions (the
+longest E.164 number) and the digit count, so local and international
+numbers of any length sort in digit order. Lookups use binary search, so a
+query costs O(log n + k) for k results (plus merging entries added since the
+last query).
+"""
+
+import re
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import Counter, deque
+from itertools import islice
+from typing import Any, Iterable, Iterator
+
+KEY_DIGITS = 15
+LENGTH_BITS = 4
+NON_DIGITS = re.compile(r"\D")
+# Buffered entries up to this count are inserted in place instead of re-sorting
+INSERT_LIMIT = 64
+# Deletions before maintenance rebuilds the index arrays
+COMPACT_MIN_REMOVALS = 256
+# Entries copied per maintenance step
+COMPACT_CHUNK_SIZE = 2_000
+# Maintenance merges buffers larger than this fraction of the index; smaller
+# ones cost the next query less than a merge of the whole index would
+MERGE_FRACTION = 8
+
+
+def phone_key(phone: str) -> int:
+    """Pack a phone number into an integer (non-digits are ignored)."""
+
+    digits = NON_DIGITS.sub("", phone)[:KEY_DIGITS]
+    return int(digits.ljust(KEY_DIGITS, "0")) << LENGTH_BITS | len(digits)
+
+
+def key_phone(key: int) -> str:
+    """
+    Unpack a phone number from its key.
+
+    Local numbers start with 0; others get back their leading "+".
+
+    Example:
+        >>> key_phone(phone_key("+380501234567"))
+        '+380501234567'
+    """
+
+    length = key & ((1 << LENGTH_BITS) - 1)
+    digits = str(key >> LENGTH_BITS).zfill(KEY_DIGITS)[:length]
+    if not digits or digits.startswith("0"):
+        return digits
+    return f"+{digits}"
+
+
+def prefix_bounds(prefix: str) -> tuple[int, int] | None:
+    """
+    Return the inclusive key range of phones starting with a prefix.
+
+    Non-digits are ignored, so "+380" matches "+380501234567". Shorter
+    phones padded to the same digits (e.g. "+3800" for prefix "+38000")
+    sort before the low key, since the digit count breaks ties.
+
+    Returns:
+        (low, high) keys, or None if the prefix is longer than a phone.
+
+    Example:
+        >>> low, high = prefix_bounds("050")
+        >>> low <= phone_key("0501234567") <= high
+        True
+    """
+
+    digits = NON_DIGITS.sub("", prefix)
+    if len(digits) > KEY_DIGITS:
+        return None
+
+    scale = 10 ** (KEY_DIGITS - len(digits))
+    low = int(digits.ljust(KEY_DIGITS, "0"))
+    return low << LENGTH_BITS | len(digits), ((low + scale) << LENGTH_BITS) - 1
+
+
+class PhoneIndex:
+    """
+    Sorted index of (phone, owner name) entries.
+
+    New entries are buffered and merged on the next query: a few entries are
+    inserted in place, larger batches (bulk loads) are merged with one sort.
+    Removing a buffered entry cancels it without merging the buffer.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+
+        self._keys: array = array("q")
+        self._owners: list[str] = []
+        # Buffered (key, owner) entries with their counts
+        self._pending: Counter[tuple[int, str]] = Counter()
+        self._pending_size = 0
+        # Entries deleted from the arrays since the last rebuild
+        self._removed = 0
+
+    @classmethod
+    def build(cls, entries: Iterable[tuple[str, str]]) -> "PhoneIndex":
+        """Build an index from (phone, owner) pairs with a single sort."""
+
+        index = cls()
+        index._pending.update((phone_key(phone), owner) for phone, owner in entries)
+        index._pending_size = index._pending.total()
+        index._flush()
+        return index
+
+    def add(self, phone: str, owner: str) -> None:
+        """Add a (phone, owner) entry."""
+
+        self._pending[(phone_key(phone), owner)] += 1
+        self._pending_size += 1
+
+    def remove(self, phone: str, owner: str) -> bool:
+        """
+        Remove one (phone, owner) entry.
+
+        Returns:
+            True if the entry was found and removed.
+        """
+
+        key = phone_key(phone)
+        entry = (key, owner)
+        if entry in self._pending:
+            self._pending[entry] -= 1
+            if not self._pending[entry]:
+                del self._pending[entry]
+            self._pending_size -= 1
+            return True
+
+        low = bisect_left(self._keys, key)
+        high = bisect_right(self._keys, key, low)
+
+        for position in range(low, high):
+            if self._owners[position] == owner:
+                del self._keys[position]
+                del self._owners[position]
+                self._removed += 1
+                return True
+
+        return False
+
+    def clear(self) -> None:
+        """Remove all entries."""
+
+        self._keys = array("q")
+        self._owners = []
+        self._pending = Counter()
+        self._pending_size = 0
+        self._removed = 0
+
+    def compact(self) -> None:
+        """Merge all buffered entries, rebuilding the arrays after many deletions."""
+
+        for _ in self.compact_steps():
+            pass
+        self._flush()
+
+    def compact_steps(self, chunk_size: int = COMPACT_CHUNK_SIZE) -> Iterator[None]:
+        """
+        Merge a large buffer, rebuilding the arrays after many deletions.
+
+        The buffer is sorted in runs and merged with the arrays about
+        `chunk_size` entries per step into new arrays, which are swapped in
+        at the end; the index must not change until the steps are done.
+        Buffers smaller than `1 / MERGE_FRACTION` of the index are left to
+        the next query, so the steps do nothing on a quiet index.
+        """
+
+        size = len(self._keys)
+        rebuild = self._removed >= max(COMPACT_MIN_REMOVALS, size // 4)
+        if self._pending_size <= max(INSERT_LIMIT, size // MERGE_FRACTION):
+            if not rebuild:
+                return
+
+        runs: deque[list[tuple[int, str]]] = deque()
+        pending = self._pending.elements()
+        while run := sorted(islice(pending, chunk_size)):
+            runs.append(run)
+            yield
+
+        while len(runs) > 1:
+            merged: list[tuple[int, str]] = []
+            yield from _merge_steps(runs.popleft(), runs.popleft(), merged, chunk_size)
+            runs.append(merged)
+
+        entries: list[tuple[int, str]] = []
+        for start in range(0, size, chunk_size):
+            end = start + chunk_size
+            entries.extend(zip(self._keys[start:end], self._owners[start:end]))
+            yield
+
+        merged = []
+        run = runs.popleft() if runs else []
+        yield from _merge_steps(entries, run, merged, chunk_size)
+
+        keys = array("q")
+        owners: list[str] = []
+        for start in range(0, len(merged), chunk_size):
+            chunk = merged[start : start + chunk_size]
+            keys.extend([key for key, _ in chunk])
+            owners.extend([owner for _, owner in chunk])
+            yield
+
+        self._keys = keys
+        self._owners = owners
+        pending, self._pending = self._pending, Counter()
+        self._pending_size = 0
+        self._removed = 0
+        del entries, run
+        yield
+
+        # Free the old entries in chunks too; releasing them at once takes long
+        while merged:
+            del merged[-chunk_size:]
+            yield
+        while pending:
+            for _ in range(min(chunk_size, len(pending))):
+                pending.popitem()
+            yield
+
+    def range(self, low: str, high: str) -> list[tuple[str, str]]:
+        """Return (phone, owner) entries with low <= phone <= high."""
+
+        return self._slice(phone_key(low), phone_key(high))
+
+    def prefix(self, prefix: str) -> list[tuple[str, str]]:
+        """Return (phone, owner) entries whose phone starts with prefix."""
+
+        bounds = prefix_bounds(prefix)
+        if bounds is None:
+            return []
+        return self._slice(*bounds)
+
+    def _flush(self) -> None:
+        """Merge buffered entries into the sorted arrays."""
+
+        if not self._pending:
+            return
+
+        pending = list(self._pending.elements())
+        self._pending = Counter()
+        self._pending_size = 0
+
+        if len(pending) <= INSERT_LIMIT:
+            for key, owner in pending:
+                position = bisect_right(self._keys, key)
+                self._keys.insert(position, key)
+                self._owners.insert(position, owner)
+            return
+
+        # Timsort merges the two sorted runs in linear time
+        pending.sort()
+        entries = sorted([*zip(self._keys, self._owners), *pending])
+        self._keys = array("q", [key for key, _ in entries])
+        self._owners = [owner for _, owner in entries]
+
+    def _slice(self, low: int, high: int) -> list[tuple[str, str]]:
+        """Return entries with keys in [low, high]."""
+
+        self._flush()
+        start = bisect_left(self._keys, low)
+        end = bisect_right(self._keys, high, start)
+
+        return [
+            (key_phone(key), owner)
+            for key, owner in zip(self._keys[start:end], self._owners[start:end])
+        ]
+
+    def __len__(self) -> int:
+        """Return number of indexed entries."""
+
+        return len(self._keys) + self._pending_size
+
+
+def _merge_steps(
+    first: list[Any], second: list[Any], merged: list[Any], chunk_size: int
+) -> Iterator[None]:
+    """Merge two sorted lists into `merged`, up to 2 * chunk_size entries per step."""
+
+    i = j = 0
+    while i < len(first) and j < len(second):
+        i_end = min(i + chunk_size, len(first))
+        j_end = min(j + chunk_size, len(second))
+        # Entries up to the smaller of both chunk ends are final
+        if first[i_end - 1] <= second[j_end - 1]:
+            j_end = bisect_right(second, first[i_end - 1], j, j_end)
+        else:
+            i_end = bisect_right(first, second[j_end - 1], i, i_end)
+        # Timsort merges the two sorted runs in linear time
+        merged.extend(sorted(first[i:i_end] + second[j:j_end]))
+        i, j = i_end, j_end
+        yield
+
+    for rest, start in ((first, i), (second, j)):
+        for start in range(start, len(rest), chunk_size):
+            merged.extend(rest[start : start + chunk_size])
+            yield
+
+
+class IndexedContacts(dict):
+    """
+    CLI contacts dictionary (name -> phone) with a phone index.
+
+    Assignments and deletions keep `phone_index` in sync, so phone prefix
+    and range queries do not scan all contacts.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize contacts and index any initial entries."""
+
+        super().__init__()
+        self.phone_index: PhoneIndex = PhoneIndex()
+        self.update(*args, **kwargs)
+
+    def __setitem__(self, name: str, phone: str) -> None:
+        """Set a contact phone and update the index."""
+
+        old_phone = self.get(name)
+        if old_phone is not None:
+            self.phone_index.remove(old_phone, name)
+        super().__setitem__(name, phone)
+        self.phone_index.add(phone, name)
+
+    def __delitem__(self, name: str) -> None:
+        """Delete a contact and its index entry."""
+
+        phone = self[name]
+        super().__delitem__(name)
+        self.phone_index.remove(phone, name)
+
+    def pop(self, name: str, *default: Any) -> Any:
+        """Remove a contact and return its phone."""
+
+        if name not in self:
+            return super().pop(name, *default)
+        phone = self[name]
+        del self[name]
+        return phone
+
+    def popitem(self) -> tuple[str, str]:
+        """Remove and return the last inserted contact."""
+
+        name, phone = super().popitem()
+        self.phone_index.remove(phone, name)
+        return name, phone
+
+    def setdefault(self, name: str, phone: str) -> str:  # type: ignore[override]
+        """Return a contact phone, adding the contact if it is missing."""
+
+        if name not in self:
+            self[name] = phone
+        return self[name]
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        """Add contacts from a mapping or pairs, updating the index."""
+
+        for name, phone in dict(*args, **kwargs).items():
+            self[name] = phone
+
+    def clear(self) -> None:
+        """Remove all contacts."""
+
+        super().clear()
+        self.phone_index.clear()
+
+    def maintenance_steps(self, chunk_size: int = COMPACT_CHUNK_SIZE) -> Iterator[None]:
+        """
+        Compact the phone index in steps of `chunk_size` entries.
+
+        The dictionary itself is not rebuilt: moving its entries into a new
+        dictionary would end with one unbounded copy, and the slots of deleted
+        contacts are reused when the dictionary next grows. Yields between
+        steps, so a `MaintenanceScheduler` can pause the work; the contacts
+        must not change until the steps are done.
+        """
+
+        yield from self.phone_index.compact_steps(chunk_size)
@@ -0,0 +1,192 @@
+"""
+Phone policies module for the address book.
+
+A phone policy decides which phone numbers are valid and how they are stored:
+- Local: national numbers with a leading 0 (e.g. 0501234567)
+- E.164: international numbers with a leading + (e.g. +380501234567)
+- Per-country: international numbers of selected countries, plus national
+  numbers of the home country converted to E.164
+
+Each policy compiles its rules into one regular expression once, so checking
+and normalizing a number is a single match. Canonical forms are compact:
+digits only, with a leading + for international numbers.
+
+Usage:
+    policy = get_policy("UA,PL")
+    policy.normalize("050-123-4567")   # "+380501234567"
+    policy.normalize("+48501234567")   # "+48501234567"
+    policy.normalize("12345")          # None
+"""
+
+import re
+from functools import lru_cache
+from typing import Iterable, NamedTuple
+
+# Separators allowed in input and dropped from the canonical form
+SEPARATORS = re.compile(r"[\-()]")
+
+
+class PhoneRule(NamedTuple):
+    """One accepted number format."""
+
+    prefix: str  # literal input prefix, e.g. "+380" or "0"
+    national: str  # pattern of the digits after the prefix, e.g. r"\d{9}"
+    canonical: str  # prefix stored in the canonical form, e.g. "+380"
+
+
+class Country(NamedTuple):
+    """Numbering plan of a country."""
+
+    code: str  # country calling code
+    digits: int  # length of the national significant number
+    trunk: str  # national trunk prefix ("" if numbers are dialed without one)
+
+
+COUNTRIES: dict[str, Country] = {
+    "GB": Country("44", 10, "0"),
+    "PL": Country("48", 9, ""),
+    "UA": Country("380", 9, "0"),
+    "US": Country("1", 10, "1"),
+}
+
+
+class PhonePolicy:
+    """Compiled set of phone rules."""
+
+    def __init__(self, name: str, rules: Iterable[PhoneRule]) -> None:
+        """
+        Compile rules into one pattern.
+
+        Args:
+            name: Policy name, e.g. "local" or "UA,PL".
+            rules: Accepted formats, tried in order.
+        """
+
+        self.name = name
+        self.rules: tuple[PhoneRule, ...] = tuple(rules)
+        self._pattern = re.compile(
+            "|".join(
+                f"{re.escape(rule.prefix)}(?P<r{i}>{rule.national})"
+                for i, rule in enumerate(self.rules)
+            )
+        )
+
+    def normalize(self, phone: str) -> str | None:
+        """
+        Return the canonical form of a phone number.
+
+        Returns:
+            Canonical phone, or None if no rule accepts it.
+
+        Example:
+            >>> LOCAL.normalize("(050)123-4567")
+            '0501234567'
+            >>> LOCAL.normalize("050 123 4567")  # Spaces NOT allowed
+        """
+
+        if not isinstance(phone, str) or " " in phone:
+            return None
+
+        match = self._pattern.fullmatch(SEPARATORS.sub("", phone))
+        if match is None:
+            return None
+
+        group = match.lastgroup
+        return self.rules[int(group[1:])].canonical + match[group]  # type: ignore[index]
+
+    def canonical_prefix(self, prefix: str) -> str:
+        """
+        Return a phone prefix in the form phones are stored in.
+
+        A national prefix starting with a trunk prefix is mapped to its
+        canonical prefix, so it matches stored E.164 numbers. Other prefixes
+        are only stripped of separators.
+
+        Example:
+            >>> get_policy("UA").canonical_prefix("050")
+            '+38050'
+            >>> LOCAL.canonical_prefix("(050)")
+            '050'
+        """
+
+        compact = SEPARATORS.sub("", prefix)
+        if compact.startswith("+"):
+            return compact
+
+        for rule in self.rules:
+            if rule.prefix != rule.canonical and compact.startswith(rule.prefix):
+                return rule.canonical + compact[len(rule.prefix) :]
+        return compact
+
+    def is_valid(self, phone: str) -> bool:
+        """Check if a phone number is accepted by the policy."""
+
+        return self.normalize(phone) is not None
+
+    def __repr__(self) -> str:
+        return f"PhonePolicy({self.name!r})"
+
+
+LOCAL = PhonePolicy("local", [PhoneRule("0", r"\d{9}", "0")])
+# E.164 allows up to 15 digits; country codes never start with 0
+E164 = PhonePolicy("e164", [PhoneRule("+", r"[1-9]\d{6,14}", "+")])
+DEFAULT_POLICY = LOCAL
+
+PHONE_POLICIES: dict[str, PhonePolicy] = {"local": LOCAL, "e164": E164}
+
+
+def country_policy(home: str, *others: str) -> PhonePolicy:
+    """
+    Build a policy for international numbers of the given countries.
+
+    National numbers (with the trunk prefix) are accepted for the home
+    country only and stored in E.164 form.
+
+    Args:
+        home: Country of national numbers, e.g. "UA".
+        others: Further countries accepted in international form.
+
+    Raises:
+        ValueError: If a country is not in `COUNTRIES`.
+    """
+
+    names = [country_name.upper() for country_name in (home, *others)]
+    rules = []
+    for position, country_name in enumerate(names):
+        country = COUNTRIES.get(country_name)
+        if country is None:
+            raise ValueError(f"Unknown country: {country_name}")
+        national = rf"\d{{{country.digits}}}"
+        rules.append(PhoneRule(f"+{country.code}", national, f"+{country.code}"))
+        if position == 0:
+            rules.append(PhoneRule(country.trunk, national, f"+{country.code}"))
+
+    return PhonePolicy(",".join(names), rules)
+
+
+def get_policy(spec: str) -> PhonePolicy:
+    """
+    Return the policy for a name, compiling it once.
+
+    Args:
+        spec: "local", "e164", or comma-separated countries with the home
+              country first, e.g. "UA,PL".
+
+    Raises:
+        ValueError: If the spec names an unknown policy or country.
+    """
+
+    policy = PHONE_POLICIES.get(spec.strip().lower())
+    if policy is not None:
+        return policy
+
+    return _cached_country_policy(
+        tuple(part.strip().upper() for part in spec.split(","))
+    )
+
+
+@lru_cache(maxsize=None)
+def _cached_country_policy(countries: tuple[str, ...]) -> PhonePolicy:
+    """Compile a country policy once per list of countries."""
+
+    return country_policy(*countries)
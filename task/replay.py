@@ -0,0 +1,254 @@
+"""
+Replay module for the contact assistant bot.
+
+This module supports capacity testing of the command pipeline:
+- Recording the command stream of a session with timestamps
+- Replaying a recording at original pace or at max speed
+- Generating synthetic workloads with a configurable command mix
+- Reporting throughput and latency percentiles per command
+
+Usage:
+    python task/main.py --record session.jsonl
+    python task/replay.py session.jsonl --pace max
+    python task/replay.py --synthetic 100000 --contacts 1000 --mix add=3,phone=6,all=1
+"""
+
+import argparse
+import json
+import math
+import random
+import string
+import time
+from collections import defaultdict
+from typing import Iterable, Iterator, Optional, TextIO
+
+from handlers import execute_command
+from input_parser import parse_input
+from phone_index import IndexedContacts
+
+# Recorded event: (seconds since session start, raw input line)
+Event = tuple[float, str]
+
+DEFAULT_MIX: dict[str, float] = {"add": 0.3, "change": 0.2, "phone": 0.45, "all": 0.05}
+MIX_COMMANDS = ("add", "change", "phone", "phones", "all")
+PERCENTILES = (50, 95, 99)
+
+
+class CommandRecorder:
+    """Write raw input lines with timestamps as JSON Lines."""
+
+    def __init__(self, stream: TextIO) -> None:
+        """Initialize recorder writing to an open text stream."""
+
+        self._stream = stream
+        self._start = time.monotonic()
+
+    def record(self, user_input: str) -> None:
+        """Record one input line with its offset from the session start."""
+
+        event = {"t": round(time.monotonic() - self._start, 6), "input": user_input}
+        self._stream.write(json.dumps(event, ensure_ascii=False) + "\n")
+        self._stream.flush()
+
+
+def read_recording(path: str) -> Iterator[Event]:
+    """Read recorded events from a JSON Lines file."""
+
+    with open(path, encoding="utf-8") as stream:
+        for line in stream:
+            if line.strip():
+                event = json.loads(line)
+                yield float(event["t"]), event["input"]
+
+
+def _contact_name(index: int) -> str:
+    """Return a unique valid contact name for the given index."""
+
+    letters = []
+    while True:
+        index, digit = divmod(index, 26)
+        letters.append(string.ascii_lowercase[digit])
+        if not index:
+            break
+
+    return f"Contact {''.join(letters).capitalize()}"
+
+
+def synthetic_workload(
+    count: int,
+    contacts: int,
+    mix: Optional[dict[str, float]] = None,
+    seed: int = 42,
+) -> Iterator[Event]:
+    """
+    Generate a synthetic command stream.
+
+    Args:
+        count: Number of commands.
+        contacts: Number of distinct contact names used by the commands.
+        mix: Relative weights of "add", "change", "phone", "phones" and "all".
+        seed: Random seed for a reproducible stream.
+
+    Yields:
+        Events with a zero timestamp (meant for max-speed replay).
+    """
+
+    weights = mix or DEFAULT_MIX
+    commands = list(weights)
+    rng = random.Random(seed)
+    names = [_contact_name(index) for index in range(contacts)]
+
+    for command in rng.choices(commands, [weights[c] for c in commands], k=count):
+        if command in ("add", "change"):
+            phone = f"0{rng.randrange(10**9):09d}"
+            yield 0.0, f"{command} {rng.choice(names)} {phone}"
+        elif command == "phone":
+            yield 0.0, f"phone {rng.choice(names)}"
+        elif command == "phones":
+            yield 0.0, f"phones 0{rng.randrange(10**4):04d}"
+        else:
+            yield 0.0, command
+
+
+class ReplayReport:
+    """Latency samples per command and overall throughput."""
+
+    def __init__(self) -> None:
+        """Initialize an empty report."""
+
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.elapsed: float = 0.0
+
+    def add(self, command: str, seconds: float) -> None:
+        """Add a latency sample for a command."""
+
+        self.latencies[command or "<empty>"].append(seconds)
+
+    @staticmethod
+    def percentile(samples: list[float], percent: float) -> float:
+        """
+        Return the nearest-rank percentile of sorted samples.
+
+        Example:
+            >>> ReplayReport.percentile([1, 2, 3, 4, 5], 50)
+            3
+        """
+
+        index = max(0, math.ceil(percent / 100 * len(samples)) - 1)
+        return samples[index]
+
+    def summary(self) -> str:
+        """
+        Return a formatted table with throughput and latency per command.
+
+        Ops/s of a command is its count over the wall time of the run, so the
+        column adds up to the total throughput.
+        """
+
+        header = f"{'Command':<10} {'Count':>8} {'Ops/s':>10}" + "".join(
+            f" {f'p{p} ms':>9}" for p in PERCENTILES
+        )
+        lines = [header, "-" * len(header)]
+        total = 0
+
+        for command, samples in sorted(self.latencies.items()):
+            samples.sort()
+            total += len(samples)
+            rate = len(samples) / self.elapsed if self.elapsed else 0.0
+            lines.append(
+                f"{command:<10} {len(samples):>8} {rate:>10.0f}"
+                + "".join(
+                    f" {self.percentile(samples, p) * 1000:>9.3f}" for p in PERCENTILES
+                )
+            )
+
+        throughput = total / self.elapsed if self.elapsed else 0.0
+        lines.append(
+            f"Total: {total} commands in {self.elapsed:.2f} s ({throughput:.0f} ops/s)"
+        )
+        return "\n".join(lines)
+
+
+def replay(
+    events: Iterable[Event],
+    pace: str = "max",
+    speed: float = 1.0,
+    contacts: Optional[dict[str, str]] = None,
+) -> ReplayReport:
+    """
+    Replay events against `execute_command`.
+
+    Args:
+        events: Recorded or synthetic events.
+        pace: "original" to keep recorded gaps between commands, or "max"
+              to run commands back to back.
+        speed: Time scale for original pace (2.0 replays twice as fast).
+        contacts: Contacts to run against; new empty `IndexedContacts`
+                  (as used by `main`) by default.
+
+    Returns:
+        Report with latency samples per command.
+    """
+
+    contacts = IndexedContacts() if contacts is None else contacts
+    report = ReplayReport()
+    start = time.perf_counter()
+
+    for offset, user_input in events:
+        if pace == "original":
+            delay = offset / speed - (time.perf_counter() - start)
+            if delay > 0:
+                time.sleep(delay)
+
+        began = time.perf_counter()
+        command, args = parse_input(user_input)
+        if command in ["close", "exit"]:
+            break
+        execute_command(command, args, contacts)
+        report.add(command, time.perf_counter() - began)
+
+    report.elapsed = time.perf_counter() - start
+    return report
+
+
+def parse_mix(text: str) -> dict[str, float]:
+    """Parse a command mix like "add=3,phone=6,all=1"."""
+
+    mix: dict[str, float] = {}
+    for part in text.split(","):
+        command, _, weight = part.partition("=")
+        if command.strip() not in MIX_COMMANDS:
+            raise argparse.ArgumentTypeError(f"unknown command in mix: {command}")
+        mix[command.strip()] = float(weight or 1)
+    return mix
+
+
+def main() -> None:
+    """Replay a recording or a synthetic workload and print the report."""
+
+    parser = argparse.ArgumentParser(description="Replay commands and report latency.")
+    parser.add_argument("recording", nargs="?", help="JSON Lines recording to replay")
+    parser.add_argument("--pace", choices=("original", "max"), default="original")
+    parser.add_argument("--speed", type=float, default=1.0)
+    parser.add_argument("--synthetic", type=int, help="number of synthetic commands")
+    parser.add_argument("--contacts", type=int, default=1000)
+    parser.add_argument("--mix", type=parse_mix, default=DEFAULT_MIX)
+    parser.add_argument("--seed", type=int, default=42)
+    options = parser.parse_args()
+
+    if options.synthetic:
+        events = synthetic_workload(
+            options.synthetic, options.contacts, options.mix, options.seed
+        )
+        pace = "max"
+    elif options.recording:
+        events = read_recording(options.recording)
+        pace = options.pace
+    else:
+        parser.error("give a recording file or --synthetic N")
+
+    print(replay(events, pace, options.speed).summary())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,377 @@
+"""
+Read replicas module for the address book.
+
+This module publishes immutable snapshots of an `AddressBook` into
+`multiprocessing.shared_memory`, so other processes can read it without
+copying or pickling:
+- Names sorted in one UTF-8 arena with offsets (binary search by name)
+- Phones of every record packed into phone index keys
+- A sorted phone column with owner ids (phone lookups and prefix queries)
+
+Each publish writes a new segment (a generation) and then bumps the
+generation number in a small control segment. Readers switch to the new
+generation on `refresh()`, so writers never wait for readers.
+
+Usage:
+    # Writer process
+    publisher = SnapshotPublisher("contacts")
+    publisher.publish(book)
+
+    # Worker process: only the base name is passed around
+    reader = SnapshotReader("contacts")
+    reader.find("John")          # ["0501234567", ...]
+    reader.find_phone("0501234567")  # ["John"]
+"""
+
+import struct
+import threading
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Mapping
+
+from task.phone_index import key_phone, phone_key, prefix_bounds
+
+MAGIC = b"ABSNAP02"
+# magic, generation, name count, phone count, arena size.
+# Sections use native byte order: replicas live on the same machine.
+HEADER = struct.Struct("<8sQQQQ")
+CONTROL = struct.Struct("<Q")
+ATTACH_RETRIES = 5
+# Held while `_attach` switches off resource tracking (Python < 3.13)
+_tracker_lock = threading.Lock()
+
+
+def _align(size: int) -> int:
+    """Round size up to a multiple of 8 bytes."""
+
+    return (size + 7) & ~7
+
+
+def _layout(names: int, phones: int, arena: int) -> list[tuple[str, int, int]]:
+    """Return (section, offset, size) for every section of a snapshot."""
+
+    sections = [
+        ("name_offsets", 8 * (names + 1)),
+        ("phone_offsets", 8 * (names + 1)),
+        ("record_phones", 8 * phones),
+        ("phone_keys", 8 * phones),
+        ("phone_owners", 8 * phones),
+        ("arena", arena),
+    ]
+    layout = []
+    offset = _align(HEADER.size)
+    for section, size in sections:
+        layout.append((section, offset, size))
+        offset += _align(size)
+    return layout
+
+
+def _segment_name(base_name: str, generation: int) -> str:
+    """Return the shared memory name of a snapshot generation."""
+
+    return f"{base_name}_g{generation}"
+
+
+def _create(name: str, size: int) -> shared_memory.SharedMemory:
+    """Create a segment, never while `_attach` has registration switched off."""
+
+    with _tracker_lock:
+        return shared_memory.SharedMemory(name=name, create=True, size=size)
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """
+    Attach to an existing segment without registering it for cleanup.
+
+    Otherwise the resource tracker of a reader process would unlink the
+    publisher's segment when the reader exits.
+
+    Before Python 3.13, registration is switched off for the whole process
+    during the attach. Segments of this module are created under the same
+    lock, but shared memory created by other code in another thread at that
+    moment is not tracked (and not cleaned up if the process dies).
+    """
+
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:  # Python < 3.13 has no `track` argument
+        pass
+
+    # Skip registration instead of unregistering afterwards: a reader in the
+    # publisher's process (or a child process) shares its resource tracker,
+    # which keeps one entry per name
+    with _tracker_lock:
+        register = resource_tracker.register
+        resource_tracker.register = lambda *args, **kwargs: None
+        try:
+            return shared_memory.SharedMemory(name=name)
+        finally:
+            resource_tracker.register = register
+
+
+def pack_snapshot(book: Mapping[str, Any], generation: int) -> tuple[int, Any]:
+    """
+    Serialize a book into the snapshot layout.
+
+    Returns:
+        Tuple of (total size, writer function taking a writable buffer).
+    """
+
+    source = getattr(book, "data", book)  # skip UserDict's Python-level items()
+    records = sorted((name.encode("utf-8"), record) for name, record in source.items())
+
+    name_offsets = [0]
+    phone_offsets = [0]
+    record_phones: list[int] = []
+    phone_owners: list[int] = []
+
+    for owner_id, (encoded, record) in enumerate(records):
+        name_offsets.append(name_offsets[-1] + len(encoded))
+        for phone in record.phones:
+            record_phones.append(phone_key(phone.value))
+            phone_owners.append(owner_id)
+        phone_offsets.append(len(record_phones))
+
+    # Stable sort keeps owners ascending for equal phones
+    order = sorted(range(len(record_phones)), key=record_phones.__getitem__)
+    arena = b"".join(encoded for encoded, _ in records)
+    layout = _layout(len(records), len(record_phones), len(arena))
+    sections = {
+        "name_offsets": array("Q", name_offsets).tobytes(),
+        "phone_offsets": array("Q", phone_offsets).tobytes(),
+        "record_phones": array("q", record_phones).tobytes(),
+        "phone_keys": array("q", [record_phones[i] for i in order]).tobytes(),
+        "phone_owners": array("q", [phone_owners[i] for i in order]).tobytes(),
+        "arena": arena,
+    }
+    _, last_offset, last_size = layout[-1]
+
+    def write(buffer: memoryview) -> None:
+        HEADER.pack_into(
+            buffer, 0, MAGIC, generation, len(records), len(record_phones), len(arena)
+        )
+        for section, offset, size in layout:
+            buffer[offset : offset + size] = sections[section]
+
+    return max(1, last_offset + last_size), write
+
+
+class SnapshotPublisher:
+    """Publish generations of an address book snapshot to shared memory."""
+
+    def __init__(self, base_name: str, keep: int = 2) -> None:
+        """
+        Create the control segment.
+
+        Args:
+            base_name: Name shared with reader processes.
+            keep: Number of latest generations kept alive, giving slow
+                  readers time to attach before a generation is unlinked.
+        """
+
+        self.base_name = base_name
+        self.keep = max(1, keep)
+        self.generation = 0
+        self._control = _create(f"{base_name}_ctl", CONTROL.size)
+        CONTROL.pack_into(self._control.buf, 0, 0)
+        self._segments: list[shared_memory.SharedMemory] = []
+
+    def publish(self, book: Mapping[str, Any]) -> int:
+        """
+        Write a new snapshot generation and make it current.
+
+        Returns:
+            The published generation number.
+        """
+
+        generation = self.generation + 1
+        size, write = pack_snapshot(book, generation)
+        segment = _create(_segment_name(self.base_name, generation), size)
+        write(segment.buf)
+
+        # Readers pick up the new generation on their next refresh
+        CONTROL.pack_into(self._control.buf, 0, generation)
+        self.generation = generation
+        self._segments.append(segment)
+
+        while len(self._segments) > self.keep:
+            old = self._segments.pop(0)
+            old.close()
+            old.unlink()
+
+        return generation
+
+    def close(self) -> None:
+        """Unlink all generations and the control segment."""
+
+        for segment in self._segments:
+            segment.close()
+            segment.unlink()
+        self._segments = []
+        self._control.close()
+        self._control.unlink()
+
+    def __enter__(self) -> "SnapshotPublisher":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class SnapshotReader:
+    """
+    Zero-copy read access to the current snapshot generation.
+
+    A reader attached before the first publish sees an empty book until a
+    `refresh()` picks up generation 1.
+    """
+
+    def __init__(self, base_name: str) -> None:
+        """Attach to the control segment and the current generation."""
+
+        self.base_name = base_name
+        self.generation = 0
+        self._control = _attach(f"{base_name}_ctl")
+        self._segment: shared_memory.SharedMemory | None = None
+        self._views: dict[str, memoryview] = {}
+        self.refresh()
+
+    def refresh(self) -> bool:
+        """
+        Switch to the latest published generation.
+
+        Returns:
+            True if a newer generation was attached.
+        """
+
+        for _ in range(ATTACH_RETRIES):
+            (generation,) = CONTROL.unpack_from(self._control.buf, 0)
+            if generation == self.generation:
+                return False
+            try:
+                segment = _attach(_segment_name(self.base_name, generation))
+            except FileNotFoundError:
+                # Unlinked by a newer publish in the meantime; read again
+                time.sleep(0)
+                continue
+
+            self._detach()
+            self._segment = segment
+            self.generation = generation
+            self._map_views()
+            return True
+
+        raise RuntimeError(f"Could not attach to snapshot {self.base_name}")
+
+    def _map_views(self) -> None:
+        """Create typed memoryviews over the sections of the segment."""
+
+        buffer = self._segment.buf  # type: ignore[union-attr]
+        magic, _, names, phones, arena = HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC:
+            raise ValueError(f"Not an address book snapshot: {self.base_name}")
+
+        for section, offset, size in _layout(names, phones, arena):
+            view = buffer[offset : offset + size]
+            self._views[section] = (
+                view
+                if section == "arena"
+                else view.cast("Q" if section.endswith("offsets") else "q")
+            )
+
+    def _detach(self) -> None:
+        """Release views and close the current segment."""
+
+        for view in self._views.values():
+            view.release()
+        self._views = {}
+        if self._segment is not None:
+            self._segment.close()
+            self._segment = None
+
+    def close(self) -> None:
+        """Detach from the snapshot and the control segment."""
+
+        self._detach()
+        self._control.close()
+
+    def __enter__(self) -> "SnapshotReader":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        """Return number of records in the snapshot (0 before the first publish)."""
+
+        if not self.generation:
+            return 0
+        return len(self._views["name_offsets"]) - 1
+
+    def _name_bytes(self, owner_id: int) -> bytes:
+        """Return the encoded name of a record."""
+
+        offsets = self._views["name_offsets"]
+        return bytes(self._views["arena"][offsets[owner_id] : offsets[owner_id + 1]])
+
+    def name_of(self, owner_id: int) -> str:
+        """Return the name of a record by its id."""
+
+        return self._name_bytes(owner_id).decode("utf-8")
+
+    def _owner_id(self, name: str) -> int | None:
+        """Binary search the sorted name arena for a name."""
+
+        target = name.encode("utf-8")
+        low, high = 0, len(self)
+        while low < high:
+            middle = (low + high) // 2
+            if self._name_bytes(middle) < target:
+                low = middle + 1
+            else:
+                high = middle
+
+        if low < len(self) and self._name_bytes(low) == target:
+            return low
+        return None
+
+    def find(self, name: str) -> list[str] | None:
+        """Return phones of a record, or None if the name is not in the snapshot."""
+
+        owner_id = self._owner_id(name)
+        if owner_id is None:
+            return None
+
+        offsets = self._views["phone_offsets"]
+        phones = self._views["record_phones"][offsets[owner_id] : offsets[owner_id + 1]]
+        return [key_phone(phone) for phone in phones]
+
+    def find_phone(self, phone: str) -> list[str]:
+        """Return names of all records owning a phone number."""
+
+        if not self.generation:
+            return []
+
+        key = phone_key(phone)
+        keys = self._views["phone_keys"]
+        start = bisect_left(keys, key)
+        end = bisect_right(keys, key, start)
+        return [self.name_of(owner) for owner in self._views["phone_owners"][start:end]]
+
+    def find_by_phone_prefix(self, prefix: str) -> list[tuple[str, str]]:
+        """Return (phone, name) pairs whose phone starts with prefix."""
+
+        bounds = prefix_bounds(prefix)
+        if bounds is None or not self.generation:
+            return []
+
+        keys = self._views["phone_keys"]
+        start = bisect_left(keys, bounds[0])
+        end = bisect_right(keys, bounds[1], start)
+        owners = self._views["phone_owners"]
+
+        return [
+            (key_phone(keys[i]), self.name_of(owners[i])) for i in range(start, end)
+        ]
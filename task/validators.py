@@ -2,23 +2,59 @@
 Validators module for the contact assistant bot.
 
 This module provides validation functions for different argument types:
-- Phone number validation
+- Phone number validation by a phone policy (local numbers by default)
 - Name validation
 - General format validators
 """
 
 import re
+from typing import TYPE_CHECKING
 
+if TYPE_CHECKING:
+    from phone_policies import PhonePolicy
 
-def is_valid_phone(phone: str) -> bool:
+# Phone policy used by `is_valid_phone` (see `set_phone_policy`)
+_phone_settings: dict[str, "PhonePolicy | None"] = {"policy": None}
+
+
+def set_phone_policy(policy: "PhonePolicy | None") -> None:
+    """
+    Select the phone policy for `is_valid_phone` and the CLI handlers.
+
+    Args:
+        policy: A `phone_policies.PhonePolicy`, or None for local numbers.
+    """
+
+    _phone_settings["policy"] = policy
+
+
+def get_phone_policy() -> "PhonePolicy":
+    """Return the selected phone policy, or the default local policy."""
+
+    policy = _phone_settings["policy"]
+    if policy is None:
+        # Imported on first use, by the CLI only: the models package imports
+        # this module as `task.validators` for names and must not load a
+        # second copy of the policies with their own `LOCAL` and cache
+        from phone_policies import (  # pylint: disable=import-outside-toplevel
+            DEFAULT_POLICY,
+        )
+
+        policy = _phone_settings["policy"] = DEFAULT_POLICY
+    return policy
+
+
+def is_valid_phone(phone: str, policy: "PhonePolicy | None" = None) -> bool:
     """
     Validate phone number format.
 
-    Accepts local numbers only (10 digits starting with 0).
-    Allows hyphens and parentheses as separators, but no spaces or '+'.
+    Uses the same rules as the `Phone` field: the given policy, the one
+    selected with `set_phone_policy`, or local numbers (10 digits starting
+    with 0). Allows hyphens and parentheses as separators, but no spaces.
 
     Args:
         phone: Phone number string without spaces.
+        policy: Optional phone policy overriding the selected one.
 
     Returns:
         True if phone number is valid, False otherwise.
@@ -32,15 +68,41 @@ def is_valid_phone(phone: str) -> bool:
         False
         >>> is_valid_phone("098 765-4321")  # Spaces NOT allowed
         False
+        >>> is_valid_phone("098.765.4321")  # Only hyphens and parentheses
+        False
+    """
+    return (policy or get_phone_policy()).is_valid(phone)
+
+
+def is_valid_phone_prefix(prefix: str) -> bool:
+    """
+    Validate a phone number prefix for phone queries.
+
+    Accepts 1 to 15 digits (the longest E.164 number), optionally separated
+    by hyphens or parentheses, with an optional leading '+'.
+
+    Args:
+        prefix: Prefix string without spaces.
+
+    Returns:
+        True if prefix is valid, False otherwise.
+
+    Example:
+        >>> is_valid_phone_prefix("050")
+        True
+        >>> is_valid_phone_prefix("050-123")
+        True
+        >>> is_valid_phone_prefix("+380")
+        True
+        >>> is_valid_phone_prefix("abc")
+        False
     """
-    if not isinstance(phone, str) or " " in phone:  # Reject if spaces present
+    if not isinstance(prefix, str) or not re.fullmatch(r"\+?[\d\-()]+", prefix):
         return False
 
-    # Extract only digits
-    digits_only = re.sub(r"\D", "", phone)
+    digits_only = re.sub(r"\D", "", prefix)
 
-    # Local format: exactly 10 digits starting with 0, NO '+' allowed
-    return len(digits_only) == 10 and digits_only.startswith("0") and "+" not in phone
+    return 1 <= len(digits_only) <= 15
 
 
 def is_valid_name(name: str) -> bool:
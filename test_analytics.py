@@ -0,0 +1,177 @@
+"""
+Tests for the vectorized phone analytics.
+
+`PhoneColumns` results are compared with pure-Python walks over the same
+records, for books mixing local and E.164 numbers.
+
+Run from the repository root:
+
+    python -m pytest -q test_analytics.py
+"""
+
+import random
+import string
+from collections import Counter
+from typing import Mapping
+
+import pytest
+
+from task.analytics import PhoneColumns
+from task.models import AddressBook, Record
+from task.phone_index import phone_key
+from task.phone_policies import E164, LOCAL
+
+SEEDS = range(10)
+
+
+def make_records(rng: random.Random, size: int) -> dict[str, Record]:
+    """Return records with local or E.164 phones from a small, shared pool."""
+
+    records: dict[str, Record] = {}
+    for index in range(size):
+        name = f"Name {string.ascii_uppercase[index // 26]}{string.ascii_lowercase[index % 26]}"
+        if rng.random() < 0.5:
+            record = Record(name, LOCAL)
+            phones = [f"0{rng.choice('5679')}0{rng.randrange(30):07d}"]
+        else:
+            record = Record(name, E164)
+            phones = [
+                f"+{rng.choice(['380', '48', '1'])}{rng.randrange(30):0{length}d}"
+                for length in (9, rng.randrange(6, 12))
+            ]
+        for phone in phones[: rng.randrange(4)]:
+            record.add_phone(phone)
+        records[name] = record
+    return records
+
+
+def rows(book: Mapping[str, Record]) -> list[tuple[str, str]]:
+    """Return (phone, name) rows in book order."""
+
+    return [
+        (phone.value, name) for name, record in book.items() for phone in record.phones
+    ]
+
+
+def python_prefix_histogram(book: Mapping[str, Record], length: int) -> dict[str, int]:
+    """Count phones per prefix of `length` digits, keeping the "+" label."""
+
+    counts = Counter(
+        phone[: length + phone.startswith("+")]
+        for phone, _ in rows(book)
+        if len(phone.lstrip("+")) >= length
+    )
+    return dict(sorted(counts.items(), key=lambda item: item[0].lstrip("+")))
+
+
+def python_shared_phones(book: Mapping[str, Record]) -> dict[str, list[str]]:
+    """Map phones of several contacts to their owners in book order."""
+
+    owners: dict[str, list[str]] = {}
+    for phone, name in rows(book):
+        if name not in owners.setdefault(phone, []):
+            owners[phone].append(name)
+    return {phone: names for phone, names in owners.items() if len(names) > 1}
+
+
+def python_select(
+    book: Mapping[str, Record], low: int, high: int
+) -> list[tuple[str, str]]:
+    """Return rows with keys in [low, high], sorted by key."""
+
+    return sorted(
+        (
+            (phone, name)
+            for phone, name in rows(book)
+            if low <= phone_key(phone) <= high
+        ),
+        key=lambda row: phone_key(row[0]),
+    )
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_columns_match_python_loops(seed: int) -> None:
+    """Histograms, shared phones and queries agree with pure-Python walks."""
+
+    rng = random.Random(seed)
+    book = make_records(rng, 60)
+    columns = PhoneColumns.from_book(book)
+
+    assert len(columns) == len(rows(book))
+    for length in (1, 3, 4):
+        histogram = columns.prefix_histogram(length)
+        assert histogram == python_prefix_histogram(book, length)
+        assert list(histogram) == list(python_prefix_histogram(book, length))
+
+    shared = columns.shared_phones()
+    assert shared == python_shared_phones(book)
+    assert shared
+
+    for prefix in ["0", "050", "+380", "+4800", "1", "+1000000001", "9"]:
+        assert columns.prefix_query(prefix) == [
+            (phone, name)
+            for phone, name in python_select(book, 0, 2**63 - 1)
+            if phone.lstrip("+").startswith(prefix.lstrip("+"))
+        ]
+
+    phones = sorted({phone for phone, _ in rows(book)}, key=phone_key)
+    for _ in range(10):
+        low, high = sorted(rng.sample(phones, 2), key=phone_key)
+        assert columns.range_query(low, high) == python_select(
+            book, phone_key(low), phone_key(high)
+        )
+
+
+def test_empty_book() -> None:
+    """An empty book has no rows, prefixes or shared phones."""
+
+    columns = PhoneColumns.from_book(AddressBook())
+
+    assert len(columns) == 0
+    assert columns.prefix_histogram() == {}
+    assert columns.shared_phones() == {}
+    assert columns.prefix_query("050") == []
+    assert columns.range_query("0500000000", "0509999999") == []
+
+
+def test_shared_phones_of_an_address_book() -> None:
+    """A phone listed twice by one contact is shared only with other contacts."""
+
+    book = AddressBook()
+    for name, phones in [
+        ("John", ["0501234567", "0501234567"]),
+        ("Jane", ["0501234567", "0671234567"]),
+        ("Anna", ["0671234567"]),
+        ("Mark", ["0931234567", "0931234567"]),
+    ]:
+        record = Record(name)
+        for phone in phones:
+            record.add_phone(phone)
+        book.add_record(record)
+
+    columns = PhoneColumns.from_book(book)
+
+    assert columns.shared_phones() == {
+        "0501234567": ["John", "Jane"],
+        "0671234567": ["Jane", "Anna"],
+    }
+    assert columns.prefix_histogram() == {"050": 3, "067": 2, "093": 2}
+    assert columns.prefix_histogram(11) == {}
+    with pytest.raises(ValueError):
+        columns.prefix_histogram(16)
+
+
+def test_histogram_skips_shorter_phones() -> None:
+    """Zero-padded keys never count a short phone under a longer prefix."""
+
+    book = {}
+    for name, phone in [("John", "+1234567"), ("Jane", "+12345670")]:
+        record = Record(name, E164)
+        record.add_phone(phone)
+        book[name] = record
+
+    columns = PhoneColumns.from_book(book)
+
+    assert columns.prefix_histogram(7) == {"+1234567": 2}
+    assert columns.prefix_histogram(8) == {"+12345670": 1}
+    assert columns.prefix_histogram(9) == {}
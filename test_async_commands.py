@@ -0,0 +1,141 @@
+"""
+Tests for the asyncio command path and the `async_` decorators.
+
+Run from the repository root:
+
+    python -m pytest -q test_async_commands.py
+"""
+
+import asyncio
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+# CLI modules use flat imports, as when running task/main.py
+sys.path.insert(0, str(Path(__file__).resolve().parent / "task"))
+
+# pylint: disable=wrong-import-position,import-error
+import handlers  # noqa: E402
+from decorators import (  # noqa: E402
+    async_colored_output,
+    async_input_error,
+    async_validate_args,
+)
+from handlers import execute_command, execute_command_async  # noqa: E402
+from message_texts import (  # noqa: E402
+    INPUT_ERROR_CONTACT_NOT_FOUND,
+    INPUT_ERROR_MISSING_ARGS,
+)
+from messages import error_invalid_name_format, set_no_color  # noqa: E402
+from phone_index import IndexedContacts  # noqa: E402
+from validators import is_valid_name  # noqa: E402
+
+NAMES = [f"Name {first}{second}" for first in "ABCDEFGHIJ" for second in "abcdefghij"]
+
+
+@pytest.fixture(name="no_color")
+def fixture_no_color():
+    """Render handler output without ANSI styling."""
+
+    set_no_color(True)
+    yield
+    set_no_color(False)
+
+
+@async_colored_output()
+@async_input_error
+@async_validate_args(
+    required_count=1,
+    validators={0: is_valid_name},
+    error_messages={0: error_invalid_name_format},
+)
+async def import_contacts(args: list[str], contacts: dict[str, str]) -> str:
+    """Add contacts one by one, yielding to the event loop in between."""
+
+    for index, name in enumerate(NAMES):
+        contacts[name] = f"050{index:07d}"
+        await asyncio.sleep(0)
+    if args[0] not in contacts:
+        raise KeyError(args[0])
+    return f"Imported {len(NAMES)} contacts."
+
+
+@pytest.fixture(name="import_command")
+def fixture_import_command(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Register `import_contacts` as the coroutine command "import"."""
+
+    monkeypatch.setitem(handlers.COMMANDS, "import", (import_contacts, "args_contacts"))
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_async_commands_match_sync_commands(seed: int, no_color: None) -> None:
+    """Inline and background commands answer like the sync path."""
+
+    del no_color
+    rng = random.Random(seed)
+    sync_contacts = IndexedContacts()
+    async_contacts = IndexedContacts()
+
+    async def run() -> None:
+        for _ in range(100):
+            name = rng.choice(NAMES[:10])
+            line = rng.choice(
+                [
+                    ["add", name, f"050{rng.randrange(100):07d}"],
+                    ["change", name, f"067{rng.randrange(100):07d}"],
+                    ["phone", name],
+                    ["phones", "050"],
+                    ["all"],
+                    ["add", name],
+                    ["hello", "there"],
+                    ["unknown"],
+                    [""],
+                ]
+            )
+            command, args = line[0], line[1:]
+            expected = execute_command(command, args, sync_contacts)
+            assert await execute_command_async(command, args, async_contacts) == (
+                expected
+            )
+            assert async_contacts == sync_contacts
+
+    asyncio.run(run())
+
+
+def test_background_copy_waits_for_coroutine_handler(
+    no_color: None, import_command: None
+) -> None:
+    """A background command never copies contacts while a handler is awaited."""
+
+    del no_color, import_command
+    contacts = IndexedContacts()
+
+    async def run() -> tuple[str, str]:
+        importing = asyncio.create_task(
+            execute_command_async("import", [NAMES[0]], contacts)
+        )
+        await asyncio.sleep(0)  # the import holds the lock while it awaits
+        listing = await execute_command_async("all", [], contacts)
+        return await importing, listing
+
+    imported, listing = asyncio.run(run())
+
+    assert imported == f"Imported {len(NAMES)} contacts."
+    assert len(listing.splitlines()) == 2 + len(NAMES)
+
+
+def test_async_decorators_report_input_errors(
+    no_color: None, import_command: None
+) -> None:
+    """Coroutine handlers get the same argument checks and error messages."""
+
+    del no_color, import_command
+
+    async def run(args: list[str]) -> str:
+        return await execute_command_async("import", args, IndexedContacts())
+
+    assert asyncio.run(run([])) == INPUT_ERROR_MISSING_ARGS
+    assert asyncio.run(run(["J0hn"])) == error_invalid_name_format()
+    assert asyncio.run(run(["John"])) == INPUT_ERROR_CONTACT_NOT_FOUND
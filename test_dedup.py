@@ -0,0 +1,76 @@
+"""
+Tests for duplicate detection and merging.
+
+Run from the repository root:
+
+    python -m pytest -q test_dedup.py
+"""
+
+from task.dedup import find_duplicates, merge_duplicates, score_pair
+from task.models import AddressBook, Record
+
+
+def make_book(*contacts: tuple[str, list[str]]) -> AddressBook:
+    """Build a book from (name, phones) pairs."""
+
+    book = AddressBook()
+    for name, phones in contacts:
+        record = Record(name)
+        for phone in phones:
+            record.add_phone(phone)
+        book.add_record(record)
+    return book
+
+
+def test_shared_phone_alone_is_not_a_duplicate() -> None:
+    """Family members sharing a home number are kept apart."""
+
+    book = make_book(
+        ("Anna Smith", ["0501234567", "0671111111"]),
+        ("John Smith", ["0501234567"]),
+    )
+
+    assert score_pair("Anna Smith", {"0501234567"}, "John Smith", {"0501234567"}) == 0
+    assert not find_duplicates(book)
+    assert not merge_duplicates(book)
+    assert set(book) == {"Anna Smith", "John Smith"}
+
+
+def test_same_name_without_shared_phone_is_not_merged() -> None:
+    """Namesakes with different phones are kept apart."""
+
+    book = make_book(("John Smith", ["0501234567"]), ("john smith", ["0671234567"]))
+
+    assert not find_duplicates(book)
+    assert not merge_duplicates(book)
+    assert len(book) == 2
+
+
+def test_same_name_with_shared_phone_is_merged() -> None:
+    """Name variants sharing a phone are folded into one record."""
+
+    book = make_book(
+        ("John Smith", ["0501234567", "0671234567"]),
+        ("JOHN SMITH", ["0501234567"]),
+        ("Jon Smith", ["0671234567"]),
+    )
+
+    assert merge_duplicates(book) == [["John Smith", "JOHN SMITH", "Jon Smith"]]
+    assert [phone.value for phone in book["John Smith"].phones] == [
+        "0501234567",
+        "0671234567",
+    ]
+    assert len(book) == 1
+
+
+def test_weak_candidates_merge_only_on_request() -> None:
+    """Pairs below the merge threshold are reported but merged only if asked."""
+
+    book = make_book(
+        ("John Smith", ["0501234567", "0671234567"]),
+        ("john smith", ["0501234567", "0931234567"]),
+    )
+
+    assert [candidate.score for candidate in find_duplicates(book)] == [0.75]
+    assert not merge_duplicates(book)
+    assert merge_duplicates(book, threshold=0.75) == [["John Smith", "john smith"]]
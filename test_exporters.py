@@ -0,0 +1,199 @@
+"""
+Tests for the streaming exporters and the `export` command.
+
+Every test writes a file and reads it back.
+
+Run from the repository root:
+
+    python -m pytest -q test_exporters.py
+"""
+
+import csv
+import gzip
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+from task.exporters import export_contacts
+from task.models import AddressBook, Record
+from task.phone_policies import get_policy
+
+# CLI modules use flat imports, as when running task/main.py
+sys.path.insert(0, str(Path(__file__).resolve().parent / "task"))
+
+# pylint: disable=wrong-import-position,import-error
+from handlers import execute_command  # noqa: E402
+from message_texts import EXPORT_SUCCESS, INPUT_ERROR_MISSING_ARGS  # noqa: E402
+from messages import (  # noqa: E402
+    error_export_failed,
+    error_invalid_export_filter,
+    error_invalid_export_format,
+    set_no_color,
+)
+from validators import set_phone_policy  # noqa: E402
+
+CONTACTS = {
+    "John": "0501234567",
+    'Smith, "Jr"': "0671234567",
+    "Jane": "+380931234567",
+}
+
+
+@pytest.fixture(name="no_color")
+def fixture_no_color():
+    """Render handler output without ANSI styling."""
+
+    set_no_color(True)
+    yield
+    set_no_color(False)
+
+
+def read_csv(path: Path) -> list[list[str]]:
+    """Read all CSV rows of a file."""
+
+    with open(path, encoding="utf-8", newline="") as stream:
+        return list(csv.reader(stream))
+
+
+def test_csv_quotes_special_characters(tmp_path: Path) -> None:
+    """Names with commas and quotes survive a CSV round trip."""
+
+    path = tmp_path / "contacts.csv"
+
+    assert export_contacts(CONTACTS, str(path), "csv", chunk_size=2) == 3
+    assert read_csv(path) == [["name", "phones"]] + [
+        [name, phone] for name, phone in CONTACTS.items()
+    ]
+    assert '"Smith, ""Jr"""' in path.read_text(encoding="utf-8")
+
+
+def test_records_export_all_phones(tmp_path: Path) -> None:
+    """An `AddressBook` exports every phone of a record."""
+
+    book = AddressBook()
+    record = Record("John")
+    record.add_phone("0501234567")
+    record.add_phone("0671234567")
+    book.add_record(record)
+    path = tmp_path / "contacts.jsonl"
+
+    assert export_contacts(book, str(path), "JSONL") == 1
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line) for line in lines] == [
+        {"name": "John", "phones": ["0501234567", "0671234567"]}
+    ]
+
+    path = tmp_path / "contacts.csv"
+    export_contacts(book, str(path), "csv")
+    assert read_csv(path)[1] == ["John", "0501234567;0671234567"]
+
+
+def test_vcard_escapes_text_values(tmp_path: Path) -> None:
+    """Backslashes, commas, semicolons and newlines are escaped in vCards."""
+
+    path = tmp_path / "contacts.vcf"
+
+    assert export_contacts({"A\\B,C;D\nE": "0501234567"}, str(path), "vcf") == 1
+    with open(path, encoding="utf-8", newline="") as stream:
+        text = stream.read()
+    assert text.split("\r\n") == [
+        "BEGIN:VCARD",
+        "VERSION:3.0",
+        "FN:A\\\\B\\,C\\;D\\nE",
+        "N:A\\\\B\\,C\\;D\\nE;;;;",
+        "TEL;TYPE=CELL:0501234567",
+        "END:VCARD",
+        "",
+    ]
+
+
+def test_gz_path_is_compressed(tmp_path: Path) -> None:
+    """A ".gz" path is written with gzip unless compression is turned off."""
+
+    path = tmp_path / "contacts.csv.gz"
+    export_contacts(CONTACTS, str(path), "csv")
+    with gzip.open(path, "rt", encoding="utf-8", newline="") as stream:
+        assert list(csv.reader(stream))[1] == ["John", "0501234567"]
+
+    export_contacts(CONTACTS, str(path), "csv", compress=False)
+    assert read_csv(path)[1] == ["John", "0501234567"]
+
+    path = tmp_path / "contacts.csv"
+    export_contacts(CONTACTS, str(path), "csv", compress=True)
+    assert path.read_bytes()[:2] == b"\x1f\x8b"
+
+
+def test_filters_match_name_and_phone_prefixes(tmp_path: Path) -> None:
+    """Name prefixes ignore case and phone prefixes compare digits only."""
+
+    path = tmp_path / "contacts.csv"
+
+    assert export_contacts(CONTACTS, str(path), "csv", name_prefix="j") == 2
+    assert [row[0] for row in read_csv(path)[1:]] == ["John", "Jane"]
+
+    assert export_contacts(CONTACTS, str(path), "csv", phone_prefix="050-12") == 1
+    assert read_csv(path)[1:] == [["John", "0501234567"]]
+
+    assert export_contacts(CONTACTS, str(path), "csv", phone_prefix="+380") == 1
+    assert read_csv(path)[1:] == [["Jane", "+380931234567"]]
+
+    assert (
+        export_contacts(CONTACTS, str(path), "csv", name_prefix="s", phone_prefix="050")
+        == 0
+    )
+    assert read_csv(path) == [["name", "phones"]]
+
+
+def test_phone_filter_follows_the_phone_policy(tmp_path: Path, no_color: None) -> None:
+    """National phone prefixes match E.164 phones stored under a country policy."""
+
+    del no_color
+    book = AddressBook(policy=get_policy("UA"))
+    for name, phone in [("John", "0501234567"), ("Jane", "+380931234567")]:
+        record = Record(name, book.policy)
+        record.add_phone(phone)
+        book.add_record(record)
+    path = tmp_path / "contacts.csv"
+
+    assert export_contacts(book, str(path), "csv", phone_prefix="050") == 1
+    assert read_csv(path)[1:] == [["John", "+380501234567"]]
+
+    contacts = {name: record.phones[0].value for name, record in book.items()}
+    set_phone_policy(get_policy("UA"))
+    try:
+        result = execute_command("export", ["csv", str(path), "phone=093"], contacts)
+    finally:
+        set_phone_policy(None)
+    assert result == EXPORT_SUCCESS.format(count=1, path=path)
+    assert read_csv(path)[1:] == [["Jane", "+380931234567"]]
+
+
+def test_export_command(tmp_path: Path, no_color: None) -> None:
+    """The `export` command writes filtered files and reports its errors."""
+
+    del no_color
+    path = tmp_path / "contacts.jsonl"
+
+    result = execute_command("export", ["jsonl", str(path), "NAME=jo"], CONTACTS)
+    assert result == EXPORT_SUCCESS.format(count=1, path=path)
+    assert json.loads(path.read_text(encoding="utf-8")) == {
+        "name": "John",
+        "phones": ["0501234567"],
+    }
+
+    assert execute_command("export", ["xml", str(path)], CONTACTS) == (
+        error_invalid_export_format()
+    )
+    assert execute_command("export", ["csv"], CONTACTS) == INPUT_ERROR_MISSING_ARGS
+    for token in ["age=3", "name=", "phone"]:
+        assert execute_command("export", ["csv", str(path), token], CONTACTS) == (
+            error_invalid_export_filter(token)
+        )
+
+    missing = tmp_path / "missing" / "contacts.csv"
+    assert execute_command("export", ["csv", str(missing)], CONTACTS) == (
+        error_export_failed(str(missing), "No such file or directory")
+    )
+    assert not missing.parent.exists()
@@ -0,0 +1,699 @@
+"""
+Randomized operation tests for the address book models and CLI handlers.
+
+Random sequences of add/edit/remove/delete/find operations are applied to
+`AddressBook`/`Record` and to the CLI handlers, and checked after every step
+against a plain dictionary reference model, also with international phone
+policies. Scale runs repeat the scenario with time and memory ceilings.
+
+Run from the repository root:
+
+    python -m pytest -q test_randomized_operations.py
+
+Scale runs use 10,000 contacts by default; larger ones are opt-in:
+
+    SCALE_SIZES=10000,100000,1000000 python -m pytest -q test_randomized_operations.py
+"""
+
+import asyncio
+import copy
+import os
+import random
+import string
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable
+
+import pytest
+
+from task.models import (
+    AddressBook,
+    Event,
+    EventsDropped,
+    InvalidPhoneError,
+    PhoneAdded,
+    PhoneEdited,
+    PhoneNotFoundError,
+    PhoneRemoved,
+    Record,
+    RecordAdded,
+    RecordDeleted,
+    RecordInOtherBookError,
+    address_book,
+)
+from task import phone_index as model_phone_index
+from task.phone_index import NON_DIGITS, key_phone, phone_key, prefix_bounds
+from task.phone_policies import COUNTRIES, E164, LOCAL, PhonePolicy, get_policy
+
+# CLI modules use flat imports, as when running task/main.py
+sys.path.insert(0, str(Path(__file__).resolve().parent / "task"))
+
+# pylint: disable=wrong-import-position,import-error
+from handlers import execute_command  # noqa: E402
+from input_parser import parse_input  # noqa: E402
+from messages import error_invalid_phone_format, set_no_color  # noqa: E402
+from message_texts import INPUT_ERROR_CONTACT_NOT_FOUND, NO_CONTACTS_FOUND  # noqa: E402
+import phone_index  # noqa: E402
+from phone_index import IndexedContacts  # noqa: E402
+from validators import set_phone_policy  # noqa: E402
+
+SEEDS = range(20)
+STEPS = 300
+SCALE_SIZES = [int(size) for size in os.environ.get("SCALE_SIZES", "10000").split(",")]
+# Ceilings per contact, from a measured baseline of about 42 us and 1.2 KB
+# per contact at 10k-100k contacts, plus a small allowance for interpreter
+# noise; at the default size the per-contact budget dominates
+TIME_PER_CONTACT = 100e-6
+BYTES_PER_CONTACT = 2048
+BASE_SECONDS = 0.25
+BASE_BYTES = 1024 * 1024
+# Home country first: its national numbers are stored in E.164 form
+COUNTRY_SPEC = "UA,PL,GB,US"
+
+
+def random_name(rng: random.Random, pool: int) -> str:
+    """Return a valid name from a pool of `pool` names."""
+
+    index = rng.randrange(pool)
+    letters = []
+    while True:
+        index, digit = divmod(index, 26)
+        letters.append(string.ascii_lowercase[digit])
+        if not index:
+            break
+    return f"Name {''.join(letters).capitalize()}"
+
+
+def random_phone(rng: random.Random, pool: int = 50) -> str:
+    """Return a normalized phone from a small pool, so phones collide."""
+
+    return f"050{rng.randrange(pool):07d}"
+
+
+def random_country_phone(rng: random.Random, pool: int = 50) -> str:
+    """Return a phone accepted by `COUNTRY_SPEC`, in national or international form."""
+
+    number = rng.randrange(pool)
+    country = rng.choice(list(COUNTRIES.values()))
+    form = rng.randrange(3)
+    if form == 0:  # national number of the home country
+        return f"0{number:09d}"
+    if form == 1:  # the same with separators
+        return f"(0{number // 10**7:02d}){number % 10**7:07d}"
+    return f"+{country.code}{number:0{country.digits}d}"
+
+
+def random_e164_phone(rng: random.Random, pool: int = 50) -> str:
+    """Return an E.164 phone of 7 to 15 digits."""
+
+    length = rng.randrange(7, 16)
+    return f"+{rng.randrange(1, 10)}{rng.randrange(pool):0{length - 1}d}"
+
+
+def check_book(book: AddressBook, model: dict[str, list[str]]) -> None:
+    """Assert that the book, its name table and phone index match the model."""
+
+    assert set(book.data) == set(model)
+    for name, phones in model.items():
+        record = book.find(name)
+        assert record is not None
+        assert record.name.value == name
+        assert [phone.value for phone in record.phones] == phones
+        assert book.find_by_id(book.name_id(name)) is record
+
+    assert len(book.names) == len(model)
+    assert book.find_by_id(-1) is None
+    expected_index = sorted(
+        (phone, name) for name, phones in model.items() for phone in phones
+    )
+    assert sorted(book.find_by_phone_prefix("")) == expected_index
+
+
+def apply_book_operation(
+    rng: random.Random,
+    book: AddressBook,
+    model: dict[str, list[str]],
+    pool: int,
+    make_phone: Callable[[random.Random], str] = random_phone,
+    chunk_size: int = 7,
+) -> None:
+    """
+    Apply one random operation to the book and to the reference model.
+
+    Small maintenance chunks make small test books take several steps.
+    """
+
+    name = random_name(rng, pool)
+    operation = rng.choice(
+        [
+            "add",
+            "add_phone",
+            "edit",
+            "remove_phone",
+            "delete",
+            "find",
+            "find_phone",
+            "maintenance",
+        ]
+    )
+    record = book.find(name)
+    canonical = book.policy.normalize
+
+    if operation == "add":
+        phones = [make_phone(rng) for _ in range(rng.randrange(3))]
+        new_record = Record(name, book.policy)
+        for phone in phones:
+            new_record.add_phone(phone)
+        book.add_record(new_record)
+        model[name] = [canonical(phone) for phone in phones]
+
+    elif operation == "add_phone" and record is not None:
+        phone = make_phone(rng)
+        record.add_phone(phone)
+        model[name].append(canonical(phone))
+
+    elif operation == "edit" and record is not None:
+        old = rng.choice(model[name] or [make_phone(rng)])
+        new = make_phone(rng)
+        if canonical(old) in model[name]:
+            record.edit_phone(old, new)
+            model[name][model[name].index(canonical(old))] = canonical(new)
+        else:
+            with pytest.raises(PhoneNotFoundError):
+                record.edit_phone(old, new)
+            assert not record.try_edit_phone(old, new).ok
+
+    elif operation == "remove_phone" and record is not None:
+        phone = rng.choice(model[name] or [make_phone(rng)])
+        record.remove_phone(phone)
+        model[name] = [value for value in model[name] if value != canonical(phone)]
+
+    elif operation == "delete":
+        book.delete(name)
+        model.pop(name, None)
+
+    elif operation == "find":
+        assert (record is None) == (name not in model)
+        assert book.lookup(name).ok == (name in model)
+
+    elif operation == "maintenance":
+        for _ in book.maintenance_steps(chunk_size):
+            pass
+
+    elif operation == "find_phone" and record is not None:
+        phone = make_phone(rng)
+        expected = canonical(phone) if canonical(phone) in model[name] else None
+        assert record.find_phone(phone) == expected
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_book_matches_reference_model(
+    seed: int, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Random model operations keep the book equal to the reference model."""
+
+    # Let maintenance rebuild and merge in chunks for the small test books too
+    monkeypatch.setattr(address_book, "COMPACT_MIN_REMOVALS", 1)
+    monkeypatch.setattr(model_phone_index, "COMPACT_MIN_REMOVALS", 1)
+    monkeypatch.setattr(model_phone_index, "INSERT_LIMIT", 2)
+    rng = random.Random(seed)
+    book = AddressBook()
+    model: dict[str, list[str]] = {}
+
+    # Projections maintained from change events only
+    from_callbacks: dict[str, list[str]] = {}
+    from_stream: dict[str, list[str]] = {}
+    book.events.subscribe(lambda events: apply_events(from_callbacks, events))
+    stream = book.events.stream(max_batch=3)
+
+    for _ in range(STEPS):
+        apply_book_operation(rng, book, model, pool=30)
+        check_book(book, model)
+
+        while batch := stream.get_batch():
+            apply_events(from_stream, batch)
+        assert from_callbacks == model
+        assert from_stream == model
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_copies_and_other_books_stay_independent(seed: int) -> None:
+    """Copies and records moved to another book never change the first book."""
+
+    rng = random.Random(seed)
+    book = AddressBook()
+    model: dict[str, list[str]] = {}
+    projection: dict[str, list[str]] = {}
+    book.events.subscribe(lambda events: apply_events(projection, events))
+
+    for _ in range(STEPS // 3):
+        apply_book_operation(rng, book, model, pool=30)
+
+    copied = copy.copy(book) if seed % 2 else book.copy()
+    copied_model = {name: list(phones) for name, phones in model.items()}
+    check_book(copied, copied_model)
+    for _ in range(STEPS // 3):
+        apply_book_operation(rng, book, model, pool=30)
+        apply_book_operation(rng, copied, copied_model, pool=30)
+        check_book(book, model)
+        check_book(copied, copied_model)
+
+    # A record joins another book only once it is deleted from the first
+    other = AddressBook()
+    other_model: dict[str, list[str]] = {}
+    for name in rng.sample(sorted(model), min(5, len(model))):
+        record = book.find(name)
+        with pytest.raises(RecordInOtherBookError):
+            other.add_record(record)
+        check_book(book, model)
+
+        book.delete(name)
+        other.add_record(record)
+        other_model[name] = model.pop(name)
+    for _ in range(STEPS // 3):
+        apply_book_operation(rng, other, other_model, pool=30)
+        check_book(book, model)
+        check_book(other, other_model)
+
+    assert projection == model
+
+
+def apply_events(projection: dict[str, list[str]], events: list[Event]) -> None:
+    """Update a name -> phones projection from change events."""
+
+    for event in events:
+        if isinstance(event, RecordAdded):
+            projection[event.name] = list(event.phones)
+        elif isinstance(event, RecordDeleted):
+            del projection[event.name]
+        elif isinstance(event, PhoneAdded):
+            projection[event.name].append(event.phone)
+        elif isinstance(event, PhoneEdited):
+            phones = projection[event.name]
+            phones[phones.index(event.old_phone)] = event.new_phone
+        elif isinstance(event, PhoneRemoved):
+            projection[event.name] = [
+                phone for phone in projection[event.name] if phone != event.phone
+            ]
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_event_stream_matches_reference_model(seed: int) -> None:
+    """An async consumer of a small stream resynchronizes after drops."""
+
+    rng = random.Random(seed)
+    book = AddressBook()
+    model: dict[str, list[str]] = {}
+    projection: dict[str, list[str]] = {}
+    stream = book.events.stream(maxsize=8, max_batch=4)
+    drops = 0
+
+    async def produce() -> None:
+        for step in range(STEPS):
+            apply_book_operation(rng, book, model, pool=30)
+            if step % 25 == 0:  # bursts overflow the stream
+                await asyncio.sleep(0)
+        stream.close()
+
+    async def consume() -> None:
+        nonlocal drops
+        async for batch in stream:
+            apply_events(projection, batch)
+            if isinstance(batch[-1], EventsDropped):
+                drops += 1
+                projection.clear()
+                projection.update(
+                    (name, [phone.value for phone in record.phones])
+                    for name, record in book.data.items()
+                )
+
+    async def run() -> None:
+        await asyncio.gather(consume(), produce())
+
+    asyncio.run(run())
+    assert projection == model
+    assert drops
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_phone_key_layout(seed: int) -> None:
+    """Phone keys round-trip, sort in digit order and match prefix bounds."""
+
+    rng = random.Random(seed)
+    phones = [random_phone(rng, 10**7) for _ in range(50)]
+    phones += [random_e164_phone(rng, 10**7) for _ in range(50)]
+
+    def digits(phone: str) -> str:
+        return NON_DIGITS.sub("", phone)
+
+    assert [key_phone(phone_key(phone)) for phone in phones] == phones
+    assert sorted(phones, key=phone_key) == sorted(phones, key=digits)
+
+    for _ in range(50):
+        prefix = digits(rng.choice(phones))[: rng.randrange(16)]
+        bounds = prefix_bounds(rng.choice(["", "+"]) + prefix)
+        assert bounds is not None
+        for phone in phones:
+            assert (bounds[0] <= phone_key(phone) <= bounds[1]) == digits(
+                phone
+            ).startswith(prefix)
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+@pytest.mark.parametrize(
+    ("spec", "make_phone"),
+    [(COUNTRY_SPEC, random_country_phone), ("e164", random_e164_phone)],
+)
+def test_international_book_matches_reference_model(
+    seed: int, spec: str, make_phone: Callable[[random.Random], str]
+) -> None:
+    """Books with international policies store and index canonical phones."""
+
+    rng = random.Random(seed)
+    book = AddressBook(policy=get_policy(spec))
+    model: dict[str, list[str]] = {}
+
+    for _ in range(STEPS):
+        apply_book_operation(rng, book, model, pool=30, make_phone=make_phone)
+        check_book(book, model)
+
+        phones = [phone for phones in model.values() for phone in phones]
+        phone = rng.choice(phones or ["+380"])
+        prefix = phone[: rng.randrange(1, len(phone) + 1)]
+        digits = NON_DIGITS.sub("", prefix)
+        found = book.find_by_phone_prefix(prefix)
+        assert sorted(found) == sorted(
+            (value, owner)
+            for owner, values in model.items()
+            for value in values
+            if value.lstrip("+").startswith(digits)
+        )
+        assert [value for value, _ in found] == sorted(
+            (value for value, _ in found), key=lambda value: value.lstrip("+")
+        )
+
+
+def test_national_prefixes_follow_the_book_policy() -> None:
+    """Prefix and range queries map national numbers like stored phones."""
+
+    book = AddressBook(policy=get_policy("UA,PL"))
+    for name, phone in [
+        ("John", "0501234567"),
+        ("Jane", "+48501234567"),
+        ("Anna", "+380671234567"),
+    ]:
+        record = Record(name, book.policy)
+        record.add_phone(phone)
+        book.add_record(record)
+
+    john = [("+380501234567", "John")]
+    assert book.find_by_phone_prefix("050") == john
+    assert book.find_by_phone_prefix("(050)-12") == john
+    assert book.find_by_phone_prefix("+38050") == john
+    assert book.find_by_phone_prefix("+4850") == [("+48501234567", "Jane")]
+    assert [name for _, name in book.find_by_phone_prefix("0")] == ["John", "Anna"]
+    assert book.find_by_phone_range("0500000000", "0509999999") == john
+
+    local = AddressBook()
+    record = Record("John")
+    record.add_phone("0501234567")
+    local.add_record(record)
+    assert local.find_by_phone_prefix("050") == [("0501234567", "John")]
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_set_policy_converts_phones(seed: int) -> None:
+    """Switching policies converts phones, the index and event projections."""
+
+    rng = random.Random(seed)
+    book = AddressBook()
+    model: dict[str, list[str]] = {}
+    projection: dict[str, list[str]] = {}
+
+    def follow(events: list[Event]) -> None:
+        apply_events(projection, events)
+        # Callbacks run after the change, so the book matches the events
+        assert projection == {
+            name: [phone.value for phone in record.phones]
+            for name, record in book.data.items()
+        }
+
+    book.events.subscribe(follow)
+
+    for _ in range(STEPS // 3):
+        apply_book_operation(rng, book, model, pool=30)
+
+    policy = get_policy(COUNTRY_SPEC)
+    for name, record in book.data.items():
+        if model[name] and rng.random() < 0.5:
+            with pytest.raises(InvalidPhoneError):
+                record.set_policy(E164)  # local numbers are not E.164
+            assert record.policy is LOCAL
+        record.set_policy(policy)
+        model[name] = [f"+38{phone}" for phone in model[name]]
+    check_book(book, model)
+    assert projection == model
+
+    # Records of another policy are converted when added to the book
+    international = AddressBook(policy=policy)
+    for name in list(book.data):
+        record = Record(name)
+        for phone in model[name]:
+            record.add_phone(phone[3:])
+        international.add_record(record)
+        assert record.policy is policy
+    check_book(international, model)
+
+
+def test_failing_callback_leaves_book_consistent() -> None:
+    """An exception of a callback propagates after the change was made."""
+
+    book = AddressBook()
+    record = Record("John")
+    record.add_phone("0501234567")
+    record.add_phone("0671234567")
+    book.add_record(record)
+
+    def fail(events: list[Event]) -> None:
+        raise RuntimeError(events)
+
+    book.events.subscribe(fail)
+
+    with pytest.raises(RuntimeError):
+        record.remove_phone("0501234567")
+    check_book(book, {"John": ["0671234567"]})
+
+    with pytest.raises(RuntimeError):
+        record.set_policy(get_policy(COUNTRY_SPEC))
+    assert record.policy is get_policy(COUNTRY_SPEC)
+    check_book(book, {"John": ["+380671234567"]})
+
+
+@pytest.fixture(name="no_color")
+def fixture_no_color():
+    """Render handler output without ANSI styling."""
+
+    set_no_color(True)
+    yield
+    set_no_color(False)
+
+
+def run_cli(line: str, contacts: dict[str, str]) -> str:
+    """Parse and execute one CLI line."""
+
+    command, args = parse_input(line)
+    return execute_command(command, args, contacts)
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_handlers_match_reference_model(
+    seed: int, no_color: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Random CLI commands give the answers of a plain dictionary model."""
+
+    del no_color
+    monkeypatch.setattr(phone_index, "COMPACT_MIN_REMOVALS", 1)
+    monkeypatch.setattr(phone_index, "INSERT_LIMIT", 2)
+    rng = random.Random(seed)
+    contacts = IndexedContacts()
+    model: dict[str, str] = {}
+
+    for _ in range(STEPS):
+        name = random_name(rng, 30)
+        phone = random_phone(rng)
+        command = rng.choice(["add", "change", "phone", "phones", "all", "maintenance"])
+
+        if command == "maintenance":
+            for _ in contacts.maintenance_steps(chunk_size=7):
+                pass
+
+        elif command == "add":
+            assert run_cli(f"add {name} {phone}", contacts) == "Contact added."
+            model[name] = phone
+
+        elif command == "change":
+            result = run_cli(f"change {name} {phone}", contacts)
+            if name in model:
+                assert result == "Contact updated."
+                model[name] = phone
+            else:
+                assert result == INPUT_ERROR_CONTACT_NOT_FOUND
+
+        elif command == "phone":
+            expected = model.get(name, INPUT_ERROR_CONTACT_NOT_FOUND)
+            assert run_cli(f'phone "{name}"', contacts) == expected
+
+        elif command == "phones":
+            prefix = phone[: rng.randrange(3, 11)]
+            rows = run_cli(f"phones {prefix}", contacts).splitlines()
+            expected = sorted(
+                (value, owner)
+                for owner, value in model.items()
+                if value.startswith(prefix)
+            )
+            if not expected:
+                assert rows == [NO_CONTACTS_FOUND]
+            else:
+                found = [
+                    tuple(part.strip() for part in row.split("|")) for row in rows[2:]
+                ]
+                assert sorted((value, owner) for owner, value in found) == expected
+
+        else:
+            rows = run_cli("all", contacts).splitlines()
+            if not model:
+                assert rows == [NO_CONTACTS_FOUND]
+            else:
+                found = {
+                    owner.strip(): value.strip()
+                    for owner, value in (row.split("|") for row in rows[2:])
+                }
+                assert found == model
+
+        assert dict(contacts) == model
+        assert len(contacts.phone_index) == len(model)
+
+
+@pytest.fixture(name="country_policy")
+def fixture_country_policy():
+    """Select `COUNTRY_SPEC` as the phone policy of the CLI handlers."""
+
+    set_phone_policy(get_policy(COUNTRY_SPEC))
+    yield get_policy(COUNTRY_SPEC)
+    set_phone_policy(None)
+
+
+def test_models_load_one_copy_of_the_policies() -> None:
+    """With CLI modules importable, the models still use `task.phone_policies` only."""
+
+    code = (
+        "import sys; sys.path.insert(0, 'task'); import task.models; "
+        "print(sorted(name for name in sys.modules if 'phone_policies' in name))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=Path(__file__).resolve().parent,
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    assert result.stdout.split() == ["['task.phone_policies']"]
+
+
+def test_handlers_use_phone_policy_rules(no_color: None) -> None:
+    """Without a policy the CLI accepts exactly what the `Phone` field accepts."""
+
+    del no_color
+    contacts = IndexedContacts()
+    for phone in ["050.123.4567", "+380501234567", "05012345678", "0501234-56a"]:
+        assert run_cli(f"add John {phone}", contacts) == error_invalid_phone_format()
+    assert run_cli("add John (050)123-4567", contacts) == "Contact added."
+    assert dict(contacts) == {"John": "0501234567"}
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_handlers_store_canonical_phones(
+    seed: int, no_color: None, country_policy: PhonePolicy
+) -> None:
+    """Under a country policy the CLI stores and finds E.164 phones."""
+
+    del no_color
+    rng = random.Random(seed)
+    contacts = IndexedContacts()
+    model: dict[str, str] = {}
+
+    for _ in range(STEPS // 3):
+        name = random_name(rng, 30)
+        phone = random_country_phone(rng)
+        command = rng.choice(["add", "change", "phone"])
+        if command == "phone":
+            result = run_cli(f"phone {name}", contacts)
+            assert result == model.get(name, INPUT_ERROR_CONTACT_NOT_FOUND)
+        else:
+            run_cli(f"{command} {name} {phone}", contacts)
+            if command == "add" or name in model:
+                model[name] = country_policy.normalize(phone)
+        assert dict(contacts) == model
+
+    # National prefixes of the home country match stored E.164 phones
+    for prefix, canonical in [("+380", "+380"), ("0", "+380"), ("(050)", "+38050")]:
+        rows = run_cli(f"phones {prefix}", contacts).splitlines()[2:]
+        found = sorted(tuple(part.strip() for part in row.split("|")) for row in rows)
+        assert found == sorted(
+            (owner, value)
+            for owner, value in model.items()
+            if value.startswith(canonical)
+        )
+
+
+def run_scale_scenario(size: int) -> tuple[AddressBook, dict[str, list[str]]]:
+    """Bulk load `size` records, then apply `size` random operations."""
+
+    rng = random.Random(size)
+    book = AddressBook()
+    model: dict[str, list[str]] = {}
+
+    for index in range(size):
+        name = random_name(random.Random(index), size * 10)
+        phones = [random_phone(rng, 10**7) for _ in range(2)]
+        record = Record(name)
+        for phone in phones:
+            record.add_phone(phone)
+        book.add_record(record)
+        model[name] = phones
+
+    for _ in range(size):
+        apply_book_operation(
+            rng, book, model, pool=size, chunk_size=address_book.COMPACT_CHUNK_SIZE
+        )
+
+    return book, model
+
+
+@pytest.mark.parametrize("size", SCALE_SIZES)
+def test_scale_time_ceiling(size: int) -> None:
+    """Bulk load and random operations at scale stay within the time ceiling."""
+
+    start = time.perf_counter()
+    book, model = run_scale_scenario(size)
+    elapsed = time.perf_counter() - start
+
+    check_book(book, model)
+    assert elapsed <= BASE_SECONDS + size * TIME_PER_CONTACT, elapsed
+
+
+@pytest.mark.parametrize("size", SCALE_SIZES)
+def test_scale_memory_ceiling(size: int) -> None:
+    """Bulk load and random operations at scale stay within the memory ceiling."""
+
+    tracemalloc.start()
+    try:
+        run_scale_scenario(size)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert peak <= BASE_BYTES + size * BYTES_PER_CONTACT, peak
@@ -0,0 +1,128 @@
+"""
+Tests for the command recorder, replayer and synthetic load generator.
+
+Run from the repository root:
+
+    python -m pytest -q test_replay.py
+"""
+
+import argparse
+import io
+import sys
+from collections import Counter
+from pathlib import Path
+
+import pytest
+
+# CLI modules use flat imports, as when running task/main.py
+sys.path.insert(0, str(Path(__file__).resolve().parent / "task"))
+
+# pylint: disable=wrong-import-position,import-error
+from handlers import execute_command  # noqa: E402
+from input_parser import parse_input  # noqa: E402
+from phone_index import IndexedContacts  # noqa: E402
+from replay import (  # noqa: E402
+    CommandRecorder,
+    ReplayReport,
+    parse_mix,
+    read_recording,
+    replay,
+    synthetic_workload,
+)
+
+
+@pytest.mark.parametrize(
+    "samples, percent, expected",
+    [
+        ([1, 2, 3, 4, 5], 50, 3),
+        ([1, 2, 3, 4, 5], 95, 5),
+        ([1, 2, 3, 4, 5], 0, 1),
+        ([1, 2, 3, 4, 5], 100, 5),
+        (list(range(1, 101)), 50, 50),
+        (list(range(1, 101)), 95, 95),
+        (list(range(1, 101)), 99, 99),
+        (list(range(1, 101)), 99.5, 100),
+        ([7], 99, 7),
+    ],
+)
+def test_percentile_is_nearest_rank(
+    samples: list[int], percent: float, expected: int
+) -> None:
+    """The p-th percentile is the smallest sample with p% of samples at or below it."""
+
+    assert ReplayReport.percentile(samples, percent) == expected
+
+
+def test_parse_mix() -> None:
+    """Weights default to 1 and unknown commands are rejected."""
+
+    assert parse_mix("add=3,phone=6,all=1") == {"add": 3.0, "phone": 6.0, "all": 1.0}
+    assert parse_mix("phones, change=0.5") == {"phones": 1.0, "change": 0.5}
+    for text in ["exit=1", "add=1,", "export=2"]:
+        with pytest.raises(argparse.ArgumentTypeError):
+            parse_mix(text)
+    with pytest.raises(ValueError):
+        parse_mix("add=many")
+
+
+def test_synthetic_workload_follows_the_mix() -> None:
+    """Streams are reproducible, valid and use only the commands of the mix."""
+
+    events = list(synthetic_workload(2000, 50, {"add": 1, "phones": 1}, seed=7))
+
+    assert events == list(synthetic_workload(2000, 50, {"add": 1, "phones": 1}, seed=7))
+    assert events != list(synthetic_workload(2000, 50, {"add": 1, "phones": 1}, seed=8))
+    assert {offset for offset, _ in events} == {0.0}
+
+    commands = Counter(parse_input(line)[0] for _, line in events)
+    assert set(commands) == {"add", "phones"}
+    assert 800 < commands["add"] < 1200
+
+    contacts = IndexedContacts()
+    for _, line in events:
+        command, args = parse_input(line)
+        assert execute_command(command, args, contacts)
+    assert 0 < len(contacts) <= 50
+
+
+def test_replay_matches_direct_execution() -> None:
+    """Replay runs every command once and leaves the same contacts."""
+
+    events = list(synthetic_workload(500, 20))
+    expected = IndexedContacts()
+    for _, line in events:
+        execute_command(*parse_input(line), expected)
+
+    contacts = IndexedContacts()
+    report = replay(
+        events + [(0.0, ""), (0.0, "exit"), (0.0, "add")], contacts=contacts
+    )
+
+    assert contacts == expected
+    assert Counter({c: len(s) for c, s in report.latencies.items()}) == Counter(
+        parse_input(line)[0] or "<empty>" for _, line in events + [(0.0, "")]
+    )
+    assert report.elapsed >= sum(map(sum, report.latencies.values()))
+
+    summary = report.summary().splitlines()
+    assert summary[0].split() == "Command Count Ops/s p50 ms p95 ms p99 ms".split()
+    assert summary[-1].startswith(f"Total: {len(events) + 1} commands")
+
+
+def test_recording_replays_at_original_pace(tmp_path: Path) -> None:
+    """Recorded lines read back in order and replay keeps their (scaled) gaps."""
+
+    stream = io.StringIO()
+    recorder = CommandRecorder(stream)
+    for line in ["add John 0501234567", 'phone "John"']:
+        recorder.record(line)
+    path = tmp_path / "session.jsonl"
+    path.write_text(stream.getvalue() + "\n", encoding="utf-8")
+
+    events = list(read_recording(str(path)))
+    assert [line for _, line in events] == ["add John 0501234567", 'phone "John"']
+    assert events[0][0] <= events[1][0]
+
+    report = replay([(0.0, "hello"), (0.2, "hello")], pace="original", speed=2.0)
+    assert report.elapsed >= 0.1
+    assert len(report.latencies["hello"]) == 2
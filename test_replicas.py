@@ -0,0 +1,155 @@
+"""
+Tests for shared-memory read replicas of the address book.
+
+A reader in a second process attaches before the first publish, then
+follows generation swaps of the publisher. Readers attaching in another
+thread must not keep the publisher's segments from being tracked.
+
+Run from the repository root:
+
+    python -m pytest -q test_replicas.py
+"""
+
+import multiprocessing
+import os
+import threading
+from multiprocessing import resource_tracker
+from multiprocessing.connection import Connection
+
+import pytest
+
+from task.models import AddressBook, Record
+from task.replicas import SnapshotPublisher, SnapshotReader
+
+TIMEOUT = 30
+
+
+def make_book(contacts: dict[str, list[str]]) -> AddressBook:
+    """Build a book from a name -> phones mapping."""
+
+    book = AddressBook()
+    for name, phones in contacts.items():
+        record = Record(name)
+        for phone in phones:
+            record.add_phone(phone)
+        book.add_record(record)
+    return book
+
+
+def read_snapshot(reader: SnapshotReader) -> tuple:
+    """Return what a reader sees through its query methods."""
+
+    return (
+        reader.generation,
+        len(reader),
+        reader.find("John"),
+        reader.find_phone("0501234567"),
+        reader.find_by_phone_prefix("050"),
+    )
+
+
+def reader_process(base_name: str, connection: Connection) -> None:
+    """Attach a reader, then report its view after every publish."""
+
+    with SnapshotReader(base_name) as reader:
+        connection.send(read_snapshot(reader))
+        while connection.recv():
+            reader.refresh()
+            connection.send(read_snapshot(reader))
+
+
+def test_reader_process_follows_generations() -> None:
+    """A reader process sees an empty book, then every published generation."""
+
+    base_name = f"abtest_{os.getpid()}"
+    context = multiprocessing.get_context("spawn")
+    connection, child_connection = context.Pipe()
+
+    with SnapshotPublisher(base_name, keep=1) as publisher:
+        process = context.Process(
+            target=reader_process, args=(base_name, child_connection)
+        )
+        process.start()
+        try:
+            assert connection.poll(TIMEOUT)
+            assert connection.recv() == (0, 0, None, [], [])
+
+            publisher.publish(
+                make_book({"John": ["0501234567"], "Jane": ["0671234567"]})
+            )
+            connection.send(True)
+            assert connection.poll(TIMEOUT)
+            assert connection.recv() == (
+                1,
+                2,
+                ["0501234567"],
+                ["John"],
+                [("0501234567", "John")],
+            )
+
+            publisher.publish(
+                make_book(
+                    {
+                        "Anna": ["0501234567"],
+                        "John": ["0509999999", "0501234567"],
+                    }
+                )
+            )
+            connection.send(True)
+            assert connection.poll(TIMEOUT)
+            assert connection.recv() == (
+                2,
+                2,
+                ["0509999999", "0501234567"],
+                ["Anna", "John"],
+                [
+                    ("0501234567", "Anna"),
+                    ("0501234567", "John"),
+                    ("0509999999", "John"),
+                ],
+            )
+        finally:
+            connection.send(False)
+            process.join(TIMEOUT)
+
+    assert process.exitcode == 0
+
+
+def test_segments_published_during_attaches_are_tracked(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Readers attaching in one thread never hide a publish of another thread."""
+
+    registered: list[str] = []
+    register = resource_tracker.register
+
+    def record_register(name: str, rtype: str) -> None:
+        registered.append(name)
+        register(name, rtype)
+
+    monkeypatch.setattr(resource_tracker, "register", record_register)
+    base_name = f"abtrack_{os.getpid()}"
+    book = make_book({"John": ["0501234567"]})
+
+    with SnapshotPublisher(base_name, keep=2) as publisher:
+        publisher.publish(book)
+        done = threading.Event()
+
+        def attach_readers() -> None:
+            while not done.is_set():
+                with SnapshotReader(base_name) as reader:
+                    reader.refresh()
+
+        thread = threading.Thread(target=attach_readers)
+        thread.start()
+        try:
+            for _ in range(50):
+                publisher.publish(book)
+        finally:
+            done.set()
+            thread.join(TIMEOUT)
+
+        assert resource_tracker.register is record_register
+        assert f"/{base_name}_ctl" in registered
+        for generation in range(1, 52):
+            assert f"/{base_name}_g{generation}" in registered